@@ -2,7 +2,7 @@
 Adaptive bounds calculator for prompt predictions based on recent usage patterns
 """
 import numpy as np
-from collections import deque
+from enum import IntEnum
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import logging
@@ -11,6 +11,49 @@ from .config_loader import get_config
 logger = logging.getLogger(__name__)
 
 
+class Pattern(IntEnum):
+    """Usage pattern codes; the first three are what the pattern ring buffer stores"""
+    SIMPLE = 0
+    MODERATE = 1
+    COMPLEX = 2
+    MIXED = 3
+
+
+# Pattern labels indexed by Pattern, used at the public string boundary
+_PATTERN_LABELS = ('simple', 'moderate', 'complex', 'mixed')
+
+
+def _sorted_quantile(values: np.ndarray, q: float) -> float:
+    """Quantile of an already sorted array using linear interpolation (numpy's default)"""
+    pos = q * (len(values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(values) - 1)
+    return float(values[lo] + (values[hi] - values[lo]) * (pos - lo))
+
+
+def _bounds_kernel(values: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Numeric core of the bounds calculation
+    
+    Sorts values in place and drops IQR outliers. Returns (median, filtered)
+    where filtered is the sorted inlier view of values.
+    """
+    values.sort()
+    
+    # Remove outliers using IQR method
+    q1 = _sorted_quantile(values, 0.25)
+    q3 = _sorted_quantile(values, 0.75)
+    iqr = q3 - q1
+    
+    # Filter outliers - values is sorted, so the inliers are one contiguous slice
+    left = np.searchsorted(values, q1 - 1.5*iqr, side='left')
+    right = np.searchsorted(values, q3 + 1.5*iqr, side='right')
+    filtered = values[left:right] if right > left else values
+    
+    # Use median for balanced estimate (75th percentile was too conservative)
+    return _sorted_quantile(filtered, 0.5), filtered
+
+
 @dataclass
 class PromptBounds:
     """Represents confidence bounds for prompt predictions"""
@@ -34,8 +77,15 @@ class AdaptiveBoundsCalculator:
         
         # Use config values with hardcoded fallbacks
         self.window_size = window_size or adaptive_config.get('window_size', 20)
-        self.recent_multipliers = deque(maxlen=self.window_size)
-        self.pattern_history = deque(maxlen=self.window_size)
+        
+        # Fixed-size ring buffers: message counts and pattern codes share one head
+        self._mults = np.zeros(self.window_size, dtype=np.int32)
+        self._patterns = np.zeros(self.window_size, dtype=np.uint8)
+        self._head = 0
+        self._count = 0
+        
+        # Reused float workspace for calculate_bounds so refreshes don't allocate
+        self._scratch = np.empty(self.window_size, dtype=np.float64)
         
         # Pattern thresholds from config with fallbacks
         self.SIMPLE_THRESHOLD = adaptive_config.get('simple_threshold', 3)
@@ -49,42 +99,79 @@ class AdaptiveBoundsCalculator:
             'complex': config_defaults.get('complex', 18.0),
             'mixed': config_defaults.get('mixed', 10.0)
         }
+        self._default_multipliers = tuple(self.pattern_defaults[label] for label in _PATTERN_LABELS)
+        
+        # Running pattern counts (indexed by pattern code) over the last
+        # PATTERN_WINDOW prompts so the dominant pattern is known without a rescan
+        self.PATTERN_WINDOW = min(10, self.window_size)
+        self._pattern_counts = [0, 0, 0]
+        self._current_pattern = Pattern.MIXED
+    
+    def reset(self) -> None:
+        """Forget all recorded prompts"""
+        self._head = 0
+        self._count = 0
+        self._pattern_counts = [0, 0, 0]
+        self._current_pattern = Pattern.MIXED
+    
+    @property
+    def recent_multipliers(self) -> np.ndarray:
+        """Message counts in the window, oldest first"""
+        return self._recent_view(self._count)
+    
+    @property
+    def pattern_history(self) -> List[str]:
+        """Pattern labels in the window, oldest first"""
+        return [_PATTERN_LABELS[code] for code in self._recent_view(self._count, self._patterns)]
+    
+    def _recent_view(self, n: int, buffer: Optional[np.ndarray] = None) -> np.ndarray:
+        """Last n entries of a ring buffer, oldest first (copies only when wrapped)"""
+        if buffer is None:
+            buffer = self._mults
+        n = min(n, self._count)
+        start = (self._head - n) % self.window_size
+        if start + n <= self.window_size:
+            return buffer[start:start + n]
+        return np.concatenate((buffer[start:], buffer[:start + n - self.window_size]))
     
     def add_prompt(self, message_count: int) -> None:
         """Add a new prompt's message count to the history"""
-        self.recent_multipliers.append(message_count)
-        
         # Categorize the pattern
         if message_count <= self.SIMPLE_THRESHOLD:
-            pattern = 'simple'
+            code = Pattern.SIMPLE
         elif message_count >= self.COMPLEX_THRESHOLD:
-            pattern = 'complex'
+            code = Pattern.COMPLEX
         else:
-            pattern = 'moderate'
+            code = Pattern.MODERATE
+        
+        # Drop the prompt that slides out of the counting window
+        if self._count >= self.PATTERN_WINDOW:
+            self._pattern_counts[self._patterns[(self._head - self.PATTERN_WINDOW) % self.window_size]] -= 1
+        self._pattern_counts[code] += 1
         
-        self.pattern_history.append(pattern)
-        logger.debug(f"Added prompt with {message_count} messages (pattern: {pattern})")
+        self._mults[self._head] = message_count
+        self._patterns[self._head] = code
+        self._head = (self._head + 1) % self.window_size
+        self._count = min(self._count + 1, self.window_size)
+        
+        self._current_pattern = self._dominant_pattern()
+        logger.debug("Added prompt with %s messages (pattern: %s)", message_count, _PATTERN_LABELS[code])
     
     def get_current_pattern(self) -> str:
         """Determine the current usage pattern"""
-        if len(self.pattern_history) < 3:
-            return 'mixed'
-        
-        # Count recent patterns
-        pattern_counts = {'simple': 0, 'moderate': 0, 'complex': 0}
-        for pattern in list(self.pattern_history)[-10:]:  # Last 10 prompts
-            pattern_counts[pattern] += 1
-        
-        # Determine dominant pattern
-        total = sum(pattern_counts.values())
-        if total == 0:
-            return 'mixed'
+        return _PATTERN_LABELS[self._current_pattern]
+    
+    def _dominant_pattern(self) -> Pattern:
+        """Pick the dominant pattern from the running counts"""
+        if self._count < 3:
+            return Pattern.MIXED
         
-        for pattern, count in pattern_counts.items():
+        total = min(self._count, self.PATTERN_WINDOW)
+        for code, count in enumerate(self._pattern_counts):
             if count / total >= 0.6:  # 60% threshold for dominance
-                return pattern
+                return Pattern(code)
         
-        return 'mixed'
+        return Pattern.MIXED
     
     def calculate_bounds(self, message_limit: int, prompts_used: int, 
                         confidence: float = 0.8) -> PromptBounds:
@@ -96,121 +183,76 @@ class AdaptiveBoundsCalculator:
             prompts_used: Number of prompts already used
             confidence: Confidence level (0.8 = 80% confidence interval)
         """
-        pattern = self.get_current_pattern()
+        pattern = self._current_pattern
         
-        if len(self.recent_multipliers) < 5:
+        if self._count < 5:
             # Not enough data - use pattern-based defaults
-            multiplier = self.pattern_defaults[pattern]
-            
-            # Wide bounds due to uncertainty
-            if pattern == 'mixed':
-                lower_mult = 4.0
-                upper_mult = 10.0
-            else:
-                lower_mult = multiplier * 0.7
-                upper_mult = multiplier * 1.4
+            multiplier = self._default_multipliers[pattern]
         else:
             # Use recent data for tighter bounds
-            recent = list(self.recent_multipliers)[-10:]  # Last 10 prompts
-            
-            # Remove outliers using IQR method
-            q1 = np.percentile(recent, 25)
-            q3 = np.percentile(recent, 75)
-            iqr = q3 - q1
+            # Last 10 prompts, copied into the scratch buffer the kernel sorts in place
+            n = min(10, self._count)
+            recent = self._scratch[:n]
+            recent[:] = self._recent_view(n)
+            multiplier, filtered = _bounds_kernel(recent)
             
-            # Filter outliers
-            filtered = [x for x in recent if q1 - 1.5*iqr <= x <= q3 + 1.5*iqr]
-            
-            if not filtered:
-                filtered = recent
-            
-            # Calculate statistics on filtered data
-            median = np.median(filtered)
-            mean = np.mean(filtered)
-            std = np.std(filtered)
-            p75 = np.percentile(filtered, 75)  # 75th percentile for conservative estimate
-            
-            logger.info(f"Multiplier stats - Mean: {mean:.2f}, Median: {median:.2f}, Std: {std:.2f}, "
-                       f"75th percentile: {p75:.2f}, Data points: {len(filtered)}, Pattern: {pattern}")
-            
-            # Use median for balanced estimate (75th percentile was too conservative)
-            multiplier = median
-            
-            if pattern in ['simple', 'moderate'] and len(filtered) >= 5:
-                # Low variability patterns - tight bounds
-                std = np.std(filtered)
-                lower_mult = max(median - std, 1.0)
-                upper_mult = median + std
-            else:
-                # High variability or complex pattern - wider bounds
-                if confidence == 0.8:
-                    lower_mult = np.percentile(filtered, 10)
-                    upper_mult = np.percentile(filtered, 90)
-                elif confidence == 0.5:
-                    lower_mult = np.percentile(filtered, 25)
-                    upper_mult = np.percentile(filtered, 75)
-                else:
-                    # 95% confidence
-                    lower_mult = np.percentile(filtered, 2.5)
-                    upper_mult = np.percentile(filtered, 97.5)
-        
-        # Apply very tight bounds for practical usefulness
-        # Since we're using 75th percentile, we can use even tighter bounds
-        lower_mult = max(1.0, multiplier * 0.9)  # 90% of p75 (optimistic)
-        upper_mult = multiplier * 1.1  # 110% of p75 (conservative)
-        
-        logger.info(f"Bounds calculation - Multiplier: {multiplier:.2f}, Lower: {lower_mult:.2f}, "
-                   f"Upper: {upper_mult:.2f}, Message limit: {message_limit}")
+            # Statistics on filtered data, only computed when they will be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Multiplier stats - Mean: %.2f, Median: %.2f, Std: %.2f, "
+                             "75th percentile: %.2f, Data points: %d, Pattern: %s",
+                             filtered.mean(), multiplier, filtered.std(),
+                             _sorted_quantile(filtered, 0.75), len(filtered), _PATTERN_LABELS[pattern])
+        
+        # Apply very tight bounds around the multiplier for practical usefulness
+        lower_mult = max(1.0, multiplier * 0.9)  # 90% of multiplier (optimistic)
+        upper_mult = multiplier * 1.1  # 110% of multiplier (conservative)
+        
+        logger.debug("Bounds calculation - Multiplier: %.2f, Lower: %.2f, Upper: %.2f, Message limit: %s",
+                     multiplier, lower_mult, upper_mult, message_limit)
         
         # Ensure bounds make sense
         if upper_mult < lower_mult:
             lower_mult, upper_mult = upper_mult, lower_mult
         
-        # Calculate prompt bounds
+        # Calculate prompt bounds in one pass over (lower, expected, upper) multipliers
         # Note: Lower multiplier = more prompts possible, higher multiplier = fewer prompts
-        prompts_total_upper = int(message_limit / lower_mult)  # Most optimistic
-        prompts_total_expected = int(message_limit / multiplier) if multiplier > 0 else 0
-        prompts_total_lower = int(message_limit / upper_mult)  # Most conservative
+        mults = np.array((lower_mult, multiplier, upper_mult), dtype=np.float64)
+        prompts_total = np.divide(message_limit, mults, out=np.zeros(3),
+                                  where=mults > 0).astype(np.int64)
         
         # Subtract already used prompts
-        prompts_remaining_upper = max(0, prompts_total_upper - prompts_used)
-        prompts_remaining_expected = max(0, prompts_total_expected - prompts_used)
-        prompts_remaining_lower = max(0, prompts_total_lower - prompts_used)
+        prompts_remaining_upper, prompts_remaining_expected, prompts_remaining_lower = (
+            int(n) for n in np.maximum(prompts_total - prompts_used, 0))
         
         return PromptBounds(
             lower=prompts_remaining_lower,
             expected=prompts_remaining_expected,
             upper=prompts_remaining_upper,
             confidence_level=confidence,
-            pattern=pattern
+            pattern=_PATTERN_LABELS[pattern]
         )
     
     def get_pattern_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics for each usage pattern"""
-        if not self.recent_multipliers:
+        if not self._count:
             return {}
         
-        # Group by pattern
-        pattern_groups = {'simple': [], 'moderate': [], 'complex': []}
-        
-        for msg_count in self.recent_multipliers:
-            if msg_count <= self.SIMPLE_THRESHOLD:
-                pattern_groups['simple'].append(msg_count)
-            elif msg_count >= self.COMPLEX_THRESHOLD:
-                pattern_groups['complex'].append(msg_count)
-            else:
-                pattern_groups['moderate'].append(msg_count)
+        # Group by pattern with one boolean mask per stored pattern code
+        values = self.recent_multipliers.astype(np.float64)
+        codes = self._recent_view(self._count, self._patterns)
         
         # Calculate stats for each pattern
         stats = {}
-        for pattern, values in pattern_groups.items():
-            if values:
+        for code in (Pattern.SIMPLE, Pattern.MODERATE, Pattern.COMPLEX):
+            pattern = _PATTERN_LABELS[code]
+            group = values[codes == code]
+            if group.size:
                 stats[pattern] = {
-                    'mean': np.mean(values),
-                    'median': np.median(values),
-                    'std': np.std(values) if len(values) > 1 else 0,
-                    'count': len(values),
-                    'percentage': len(values) / len(self.recent_multipliers) * 100
+                    'mean': group.mean(),
+                    'median': np.median(group),
+                    'std': group.std() if group.size > 1 else 0,
+                    'count': int(group.size),
+                    'percentage': group.size / self._count * 100
                 }
         
-        return stats
\ No newline at end of file
+        return stats
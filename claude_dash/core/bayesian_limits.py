@@ -5,14 +5,50 @@ This module implements a Bayesian approach to discovering and updating
 beliefs about session limits (tokens, messages, prompts) based on
 historical usage data.
 """
+import math
 import numpy as np
 from typing import Dict, Tuple, List, Optional
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 from datetime import datetime, timedelta
 
+# Imported eagerly so the first credible interval doesn't pay the scipy.stats import
+try:
+    from scipy.stats import beta as _beta_dist
+except ImportError:
+    _beta_dist = None
+
 logger = logging.getLogger(__name__)
 
+# Above this alpha + beta the Beta distribution is close enough to normal
+# that mean +/- z * std_dev replaces the quantile solve
+NORMAL_APPROX_MIN_CONCENTRATION = 30
+_Z_SCORES = {0.80: 1.2816, 0.95: 1.96}
+
+# Belief increments indexed by how many of the 0.7 / 0.8 / 0.9 closeness
+# thresholds an observation clears (0 = not informative)
+_UPDATE_THRESHOLDS = (0.7, 0.8, 0.9)
+_ALPHA_STEPS = np.array([0.0, 0.3, 1.0, 2.0])
+_BETA_STEPS = np.array([0.0, 0.3, 0.5, 0.5])
+
+# Limit types in the order predictions are reported (first wins ties)
+_METRIC_KEYS = ("tokens", "messages", "prompts")
+
+
+@lru_cache(maxsize=256)
+def _beta_ppf_pair(alpha: float, beta: float, confidence: float) -> Tuple[float, float]:
+    """Central credible interval of a unit Beta distribution
+    
+    Beliefs only move by a handful of fixed increments, so the same
+    (alpha, beta, confidence) keys recur and the scipy quantile solve is cached.
+    """
+    if _beta_dist is None:
+        raise RuntimeError("scipy is required for credible_interval")
+    dist = _beta_dist(alpha, beta)
+    return (float(dist.ppf((1 - confidence) / 2)),
+            float(dist.ppf(1 - (1 - confidence) / 2)))
+
 
 @dataclass
 class LimitBelief:
@@ -36,16 +72,21 @@ class LimitBelief:
     @property
     def std_dev(self) -> float:
         """Standard deviation"""
-        return np.sqrt(self.variance)
+        # sqrt of the variance with scale pulled outside, using scalar math.sqrt
+        ab = self.alpha + self.beta
+        return math.sqrt(self.alpha * self.beta / (ab * ab * (ab + 1))) * self.scale
     
     def credible_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
         """Calculate credible interval for the limit"""
+        z = _Z_SCORES.get(confidence)
+        if z is not None and self.alpha + self.beta > NORMAL_APPROX_MIN_CONCENTRATION:
+            mean = self.mean
+            half_width = z * self.std_dev
+            return (max(0.0, mean - half_width), min(self.scale, mean + half_width))
+        
         # For Beta distribution, we can use the quantile function
-        from scipy import stats
-        dist = stats.beta(self.alpha, self.beta)
-        lower = dist.ppf((1 - confidence) / 2) * self.scale
-        upper = dist.ppf(1 - (1 - confidence) / 2) * self.scale
-        return (lower, upper)
+        lower, upper = _beta_ppf_pair(self.alpha, self.beta, confidence)
+        return (lower * self.scale, upper * self.scale)
     
     def update(self, observation: float) -> None:
         """Update belief based on observed maximum"""
@@ -55,16 +96,18 @@ class LimitBelief:
         # Only update if we saw values close to the limit
         # If we saw low values, it doesn't mean the limit is low - 
         # it just means we didn't hit the limit
-        if normalized > 0.9:  # Very close to limit - strong evidence
-            self.alpha += 2.0
-            self.beta += 0.5
-        elif normalized > 0.8:  # Close to limit - moderate evidence
-            self.alpha += 1.0
-            self.beta += 0.5
-        elif normalized > 0.7:  # Getting close - weak evidence
-            self.alpha += 0.3
-            self.beta += 0.3
-        # If < 0.7, don't update - not informative about actual limits
+        # > 0.9: strong evidence, > 0.8: moderate, > 0.7: weak, otherwise none
+        idx = sum(normalized > t for t in _UPDATE_THRESHOLDS)
+        if idx:
+            self.alpha += float(_ALPHA_STEPS[idx])
+            self.beta += float(_BETA_STEPS[idx])
+    
+    def update_batch(self, observations: np.ndarray) -> None:
+        """Fold many observed maximums into the belief at once"""
+        normalized = np.asarray(observations, dtype=np.float64) / self.scale
+        idx = sum((normalized > t).astype(np.intp) for t in _UPDATE_THRESHOLDS)
+        self.alpha += float(_ALPHA_STEPS[idx].sum())
+        self.beta += float(_BETA_STEPS[idx].sum())
 
 
 @dataclass
@@ -88,6 +131,7 @@ class BayesianLimitEstimator:
         self.limits = self._initialize_priors(plan_name)
         self.confidence_threshold = 10  # Min observations for "high confidence"
         self.total_observations = 0
+        self._cached_estimates = None  # Cleared whenever beliefs change
         
     def _initialize_priors(self, plan_name: str) -> SessionLimits:
         """Initialize prior beliefs based on documented limits"""
@@ -138,14 +182,32 @@ class BayesianLimitEstimator:
         # If we analyzed multiple sessions, count them all
         sessions_count = session_data.get('sessions_analyzed', 1)
         self.total_observations += sessions_count
+        self._cached_estimates = None
+        logger.info(f"Updated Bayesian limits after {self.total_observations} observations (added {sessions_count})")
+        
+    def update_from_sessions_batch(self, max_tokens: np.ndarray, max_messages: np.ndarray,
+                                   max_prompts: np.ndarray) -> None:
+        """Update beliefs from many sessions at once (one observation per array element)"""
+        self.limits.tokens.update_batch(max_tokens)
+        self.limits.messages.update_batch(max_messages)
+        self.limits.prompts.update_batch(max_prompts)
+        
+        sessions_count = len(max_tokens)
+        self.total_observations += sessions_count
+        self._cached_estimates = None
         logger.info(f"Updated Bayesian limits after {self.total_observations} observations (added {sessions_count})")
         
     def get_estimated_limits(self) -> Dict[str, Dict[str, float]]:
-        """Get current limit estimates with confidence intervals"""
+        """Get current limit estimates with confidence intervals
+        
+        The result is reused until the next update, so callers should treat it as read-only.
+        """
+        if self._cached_estimates is not None:
+            return self._cached_estimates
         
         confidence = 0.95 if self.total_observations >= self.confidence_threshold else 0.80
         
-        return {
+        self._cached_estimates = {
             "tokens": {
                 "estimate": self.limits.tokens.mean,
                 "std_dev": self.limits.tokens.std_dev,
@@ -167,27 +229,27 @@ class BayesianLimitEstimator:
             "total_observations": self.total_observations,
             "confidence_level": "high" if self.total_observations >= self.confidence_threshold else "learning"
         }
+        return self._cached_estimates
     
     def predict_limit_times(self, current_usage: Dict[str, float], 
                           burn_rates: Dict[str, float]) -> Dict[str, float]:
         """Predict time until each limit is reached"""
         
         estimates = self.get_estimated_limits()
-        predictions = {}
-        
-        for metric in ["tokens", "messages", "prompts"]:
-            if metric in current_usage and metric in burn_rates:
-                remaining = estimates[metric]["estimate"] - current_usage[metric]
-                if burn_rates[metric] > 0:
-                    hours_until_limit = remaining / burn_rates[metric]
-                    predictions[metric] = max(0, hours_until_limit)
-                else:
-                    predictions[metric] = float('inf')
-            else:
-                predictions[metric] = float('inf')
-                
+        estimate = np.array([estimates[metric]["estimate"] for metric in _METRIC_KEYS])
+        usage = np.array([current_usage.get(metric, 0.0) for metric in _METRIC_KEYS], dtype=np.float64)
+        rate = np.array([burn_rates.get(metric, 0.0) for metric in _METRIC_KEYS], dtype=np.float64)
+        
+        # Metrics without usage, without a burn rate or not burning never hit their limit
+        active = np.array([metric in current_usage and metric in burn_rates
+                           for metric in _METRIC_KEYS]) & (rate > 0)
+        hours = np.full(len(_METRIC_KEYS), np.inf)
+        hours[active] = np.maximum(0.0, (estimate[active] - usage[active]) / rate[active])
+        
+        predictions = {metric: float(h) for metric, h in zip(_METRIC_KEYS, hours)}
+        
         # Find which limit will be hit first
-        limiting_factor = min(predictions.keys(), key=lambda k: predictions[k])
+        limiting_factor = _METRIC_KEYS[int(np.argmin(hours))]
         predictions["limiting_factor"] = limiting_factor
         predictions["time_to_limit"] = predictions[limiting_factor]
         
@@ -6,6 +6,8 @@ import os
 import json
 import logging
 import shutil
+import threading
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -17,6 +19,9 @@ logger = logging.getLogger(__name__)
 class ConfigLoader:
     """Loads and manages Claude Dash configuration"""
     
+    # Seconds an auto-detected plan is reused before usage history is read again
+    PLAN_DETECTION_TTL = 300
+    
     def __init__(self):
         self.config_dir = Path.home() / ".claude-dash"
         self.config_path = self.config_dir / "config.json"
@@ -34,6 +39,11 @@ class ConfigLoader:
         # Load configurations
         self.config = self._load_config()
         self.pricing = self._load_pricing()
+        
+        # (monotonic time, plan) of the last auto-detection; the lock lets callers
+        # on other threads wait for a detection in progress instead of repeating it
+        self._detected_plan = None
+        self._detect_lock = threading.Lock()
     
     def _initialize_configs(self) -> None:
         """Initialize config files from defaults if they don't exist"""
@@ -177,22 +187,32 @@ class ConfigLoader:
         
         # If plan is set to "auto" or auto_detect is enabled, detect from usage
         if plan == "auto" or claude_config.get("auto_detect_plan", False):
-            detected_plan = self._detect_plan_from_usage()
+            detected_plan = self._detect_plan_cached()
             if detected_plan:
                 return detected_plan
         
         # Return configured plan or default
         return plan if plan != "auto" else "max20x"
     
+    def _detect_plan_cached(self) -> Optional[str]:
+        """Detected plan, reusing a detection from the last PLAN_DETECTION_TTL seconds"""
+        with self._detect_lock:
+            cached = self._detected_plan
+            if cached and time.monotonic() - cached[0] < self.PLAN_DETECTION_TTL:
+                return cached[1]
+            plan = self._detect_plan_from_usage()
+            self._detected_plan = (time.monotonic(), plan)
+            return plan
+    
     def _detect_plan_from_usage(self) -> Optional[str]:
         """Detect subscription plan based on historical usage"""
         try:
             # Import here to avoid circular dependency
             from ..providers.claude_code_reader import ClaudeCodeReader
             
-            reader = ClaudeCodeReader()
             # Get recent session data (last 30 days)
-            sessions = reader.get_session_history(days_back=30)
+            with ClaudeCodeReader() as reader:
+                sessions = reader.get_session_history(days_back=30)
             
             if not sessions:
                 return None
@@ -271,6 +291,7 @@ class ConfigLoader:
         """Reload configuration from files"""
         self.config = self._load_config()
         self.pricing = self._load_pricing()
+        self._detected_plan = None
         logger.info("Configuration reloaded")
 
 
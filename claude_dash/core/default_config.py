@@ -69,6 +69,7 @@ DEFAULT_CONFIG = {
         },
         "quick_start_hours": 24,
         "cache_duration_seconds": 30,
+        "parse_cache": True,  # Keep parsed JSONL files in ~/.claude-dash/cache between runs
         "adaptive_bounds": {
             "window_size": 20,
             "simple_threshold": 3,
@@ -0,0 +1,108 @@
+"""
+On-disk cache of parsed JSONL files
+
+Keeps what the reader extracted from each JSONL file so a restart only has to
+parse files that changed since they were last read.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedFileCache:
+    """One pickle per JSONL file, valid while the file's mtime and size are unchanged
+    
+    Each record holds the parse result together with the cutoff it was parsed with;
+    the reader decides whether that cutoff still covers the one it needs.
+    """
+    
+    # Bump whenever the shape of a parse result changes
+    FORMAT_VERSION = 1
+    
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _record_path(self, file_path: Path) -> Path:
+        """Cache file for a JSONL path"""
+        digest = hashlib.sha1(str(file_path).encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.pickle"
+    
+    def load(self, file_path: Path, stat: os.stat_result) -> Optional[tuple]:
+        """(cutoff, result) stored for file_path, or None if missing or stale"""
+        try:
+            with open(self._record_path(file_path), 'rb') as f:
+                record = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable parse cache for %s: %s", file_path, e)
+            return None
+        
+        if (record.get('version') != self.FORMAT_VERSION or
+                record.get('path') != str(file_path) or
+                record.get('mtime_ns') != stat.st_mtime_ns or
+                record.get('size') != stat.st_size):
+            return None
+        return record['cutoff'], record['result']
+    
+    def store(self, file_path: Path, stat: os.stat_result,
+              cutoff_time: Optional[datetime], result: tuple) -> None:
+        """Save a parse result, replacing the record atomically"""
+        record = {
+            'version': self.FORMAT_VERSION,
+            'path': str(file_path),
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'cutoff': cutoff_time,
+            'result': result,
+        }
+        record_path = self._record_path(file_path)
+        tmp_path = record_path.with_name(f"{record_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, record_path)
+        except OSError as e:
+            logger.warning("Could not write parse cache for %s: %s", file_path, e)
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+    
+    def prune(self, max_age_seconds: float) -> int:
+        """Delete records not written for max_age_seconds; returns how many went
+        
+        A record is rewritten whenever its file changes, so an old record belongs
+        to a file that was deleted, rotated away or last touched before anything
+        the reader still loads.
+        """
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        try:
+            records = list(os.scandir(self.cache_dir))
+        except OSError as e:
+            logger.debug("Could not list parse cache %s: %s", self.cache_dir, e)
+            return 0
+        
+        for record in records:
+            if not record.name.endswith(('.pickle', '.tmp')):
+                continue
+            try:
+                if record.stat().st_mtime < cutoff:
+                    os.unlink(record.path)
+                    removed += 1
+            except OSError:
+                pass
+        
+        if removed:
+            logger.debug("Pruned %d stale parse cache records", removed)
+        return removed
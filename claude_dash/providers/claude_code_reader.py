@@ -3,24 +3,105 @@ Claude Code usage reader for Anthropic usage data
 Reads JSONL files from ~/.claude/projects/ to get Claude usage
 """
 import os
-import json
-import glob
+import copy
+import mmap
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set, Callable, Any
+from typing import Dict, List, Optional, Set, Tuple, Callable, Any
 import logging
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from ..core.config_loader import get_config
 from ..core.adaptive_bounds import AdaptiveBoundsCalculator, PromptBounds
+from ..core.parse_cache import ParsedFileCache
+from ..core.paths import ClaudeDashPaths
+
+# orjson is an optional speedup for the per-line JSONL parse
+try:
+    from orjson import loads as _json_loads, JSONDecodeError as _JSONDecodeError
+except ImportError:
+    from json import loads as _json_loads, JSONDecodeError as _JSONDecodeError
+
+# ciso8601 optionally parses the 'Z'-suffixed UTC timestamps Claude Code writes;
+# otherwise dropping the suffix gives a naive datetime from one fromisoformat call
+try:
+    from ciso8601 import parse_datetime_as_naive as _parse_zulu_timestamp
+except ImportError:
+    def _parse_zulu_timestamp(timestamp_str: str) -> datetime:
+        return datetime.fromisoformat(timestamp_str[:-1])
 
 logger = logging.getLogger(__name__)
 
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# One shared string per model name seen in the JSONL files
+_MODEL_NAMES: Dict[str, str] = {}
+
+
+def _shutdown_executors(*executors: ThreadPoolExecutor) -> None:
+    """Stop a reader's thread pools without waiting for queued work"""
+    for executor in executors:
+        executor.shutdown(wait=False)
+
+
+def _utc_now() -> datetime:
+    """Current time as a naive UTC datetime, matching parsed timestamps"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _to_epoch_us(timestamp: datetime) -> int:
+    """Naive UTC datetime as integer microseconds since the epoch"""
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _parse_timestamp(timestamp_str: str) -> datetime:
+    """Parse a JSONL timestamp into a naive UTC datetime"""
+    if timestamp_str.endswith('Z'):
+        try:
+            return _parse_zulu_timestamp(timestamp_str)
+        except ValueError:
+            pass
+    
+    timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    if timestamp.tzinfo:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return timestamp
+
+
+class _BlockEndTimes:
+    """Read-only sequence of block end times, for bisecting a block list by end_time"""
+    __slots__ = ('blocks',)
+    
+    def __init__(self, blocks: List['SessionBlock']):
+        self.blocks = blocks
+    
+    def __len__(self) -> int:
+        return len(self.blocks)
+    
+    def __getitem__(self, index: int) -> datetime:
+        return self.blocks[index].end_time
+
 
 # SessionBlock class to match Claude Monitor's structure
 class SessionBlock:
     """Session block data structure matching Claude Monitor"""
+    __slots__ = (
+        'id', 'start_time', 'end_time', 'actual_end_time', 'is_active', 'is_gap',
+        'input_tokens', 'output_tokens', 'cache_creation_tokens', 'cache_read_tokens', 'total_tokens',
+        'cost_usd', 'entries', 'models', 'per_model_stats', 'sent_messages_count',
+        'user_prompt_count', 'assistant_message_count', 'multiplication_factor',
+        'prompt_timestamps', 'user_entry_count', 'entry_timestamps', 'cumulative_tokens',
+        'prompt_message_counts', 'open_prompt_messages',
+    )
+    
     def __init__(self, start_time: datetime, end_time: datetime, block_id: str):
         self.id = block_id
         self.start_time = start_time
@@ -39,6 +120,10 @@ class SessionBlock:
         # Aggregated data
         self.cost_usd = 0.0
         self.entries = []
+        # Columns parallel to entries with just what the burn rate scans read
+        self.entry_timestamps = array('q')  # Epoch microseconds
+        # Running input + output token total up to and including each entry
+        self.cumulative_tokens = array('q')
         self.models = []
         self.per_model_stats = {}
         self.sent_messages_count = 0
@@ -49,7 +134,12 @@ class SessionBlock:
         self.multiplication_factor = 7.7  # Default until calculated
         
         # Track prompt timestamps for moving average
-        self.prompt_timestamps = []  # List of datetime objects when prompts occurred
+        self.prompt_timestamps = array('q')  # Sorted epoch microseconds of prompts
+        self.user_entry_count = 0  # All user-type entries, including tool results
+        
+        # Assistant messages per finished prompt, and so far for the latest one
+        self.prompt_message_counts = array('q')
+        self.open_prompt_messages = 0
         
     def get_moving_average_prompt_rate(self, window_size: int = 20) -> Optional[float]:
         """Calculate prompt rate using a moving average of recent prompts
@@ -63,15 +153,15 @@ class SessionBlock:
         if len(self.prompt_timestamps) < 2:
             return None
             
-        # Get the most recent prompts (up to window_size)
-        recent_timestamps = sorted(self.prompt_timestamps)[-window_size:]
+        # Get the most recent prompts (up to window_size); the list is kept sorted
+        recent_timestamps = self.prompt_timestamps[-window_size:]
         
         if len(recent_timestamps) < 2:
             return None
             
         # Calculate time span from first to last in the window
-        time_span = recent_timestamps[-1] - recent_timestamps[0]
-        hours_span = time_span.total_seconds() / 3600
+        time_span_us = recent_timestamps[-1] - recent_timestamps[0]
+        hours_span = time_span_us / 1_000_000 / 3600
         
         if hours_span <= 0:
             return None
@@ -84,7 +174,7 @@ class SessionBlock:
     def duration_minutes(self) -> float:
         """Get duration of block in minutes"""
         if self.is_active:
-            end = datetime.now(timezone.utc).replace(tzinfo=None)
+            end = _utc_now()
         else:
             end = self.actual_end_time or self.end_time
         return (end - self.start_time).total_seconds() / 60.0
@@ -93,6 +183,45 @@ class SessionBlock:
 class ClaudeCodeReader:
     """Reads Claude Code usage from JSONL files"""
     
+    # Most JSONL files whose parse results are kept between full loads
+    FILE_CACHE_SIZE = 512
+    # Most threads parsing JSONL files at once; decoding mostly holds the GIL,
+    # so more threads only add contention
+    FILE_PARSE_WORKERS = 8
+    
+    # Seconds a get_usage_data(since_date) result is reused without reloading
+    USAGE_CACHE_TTL = 3.0
+    # Most since_date values whose usage results are kept
+    USAGE_CACHE_SIZE = 8
+    
+    # Explicit hours_back loads are rounded up to one of these horizons (then to
+    # whole multiples of the last) so nearby requests can share one load
+    LOAD_HORIZON_HOURS = (24, 48, 168, 720)
+    
+    # Seconds a get_historical_session_maximums result is reused per days_back
+    HISTORICAL_MAX_CACHE_TTL = 300.0
+    
+    # User entries starting with these are interrupts, empty content, system
+    # messages or session summaries rather than prompts
+    PROMPT_SKIP_PREFIXES = (
+        "[Request interrupted",
+        "(no content)",
+        "Caveat: The messages below",
+        "<user-memory-input>",
+        "This session is being continued from a previous conversation",
+        "Analysis:",
+        "Summary:",
+        "Key technical patterns:",
+        "Important errors and fixes:",
+        "Looking at this conversation",
+        "Primary Request and Intent:",
+        "Files and Code Sections:",
+        "Problem Solving:",
+        "Pending Tasks:",
+        "Current Work:",
+        "Optional Next Step:",
+    )
+    
     def __init__(self):
         # Load configuration
         self.config = get_config()
@@ -105,6 +234,11 @@ class ClaudeCodeReader:
         self.session_duration_hours = claude_config.get('session_duration_hours', 5)
         
         self._executor = ThreadPoolExecutor(max_workers=1)
+        # Separate pool for parsing JSONL files concurrently; _load_usage_entries
+        # waits on it, so sharing _executor (which runs get_usage_data) could deadlock
+        self._file_executor = ThreadPoolExecutor(max_workers=min(self.FILE_PARSE_WORKERS, os.cpu_count() or 1))
+        # Shuts the pools down on close(), when the reader is collected, or at exit
+        self._finalizer = weakref.finalize(self, _shutdown_executors, self._executor, self._file_executor)
         
         # Cache for session blocks
         self._session_blocks = []
@@ -115,10 +249,57 @@ class ClaudeCodeReader:
         self._blocks_cache_duration = timedelta(seconds=analysis_config.get("cache_duration_seconds", 30))
         self._quick_start_hours = 24
         self._full_data_loaded = False
+        # Every entry since this time is in the session blocks (None = not known)
+        self._blocks_cover_since: Optional[datetime] = None
+        # Per-file (inode, bytes consumed) so refreshes only parse appended lines
+        self._file_offsets: Dict[Path, tuple] = {}
+        # Per-model price tuples, valid for the config pricing they were read from
+        self._pricing_cache: Dict[str, tuple] = {}
+        self._pricing_source = None
+        # Per-file (mtime_ns, size, cutoff, parse result) so full loads skip unchanged files
+        self._file_cache: "OrderedDict[Path, tuple]" = OrderedDict()
+        # Second tier of the same results on disk, so restarts skip unchanged files too
+        self._disk_cache = None
+        if analysis_config.get("parse_cache", True):
+            try:
+                self._disk_cache = ParsedFileCache(ClaudeDashPaths.get_data_dir() / "cache" / "jsonl")
+                # Records older than the longest load horizon are for files no load needs
+                self._disk_cache.prune(self.LOAD_HORIZON_HOURS[-1] * 3600)
+            except OSError as e:
+                logger.warning(f"Parse cache disabled: {e}")
+        
+        # Set once warm_up has loaded the initial session blocks
+        self._warm = threading.Event()
         
         # Adaptive bounds calculator
         self._bounds_calculator = AdaptiveBoundsCalculator(window_size=30)
-        
+        # Bumped whenever the session blocks change; derived results are cached against it
+        self._blocks_version = 0
+        self._bounds_calculator_version = None
+        self._prompt_bounds_cache = None  # ((plan, prompts_used, confidence, version), bounds)
+        self._multiplication_factor_cache = None  # (version, factors)
+        # since_date -> (monotonic time, blocks version, get_usage_data result)
+        self._usage_cache: Dict[Optional[datetime], tuple] = {}
+        # days_back -> (monotonic time, get_historical_session_maximums result)
+        self._historical_max_cache: Dict[int, Tuple[float, Dict]] = {}
+        
+    def warm_up(self) -> None:
+        """Load the initial session blocks ahead of the first query
+        
+        Meant to run on a background thread while the UI starts. Other threads
+        must call wait_until_warm before using the reader.
+        """
+        try:
+            self._update_session_blocks()
+        except Exception as e:
+            logger.error(f"Error warming up reader: {e}")
+        finally:
+            self._warm.set()
+    
+    def wait_until_warm(self, timeout: Optional[float] = None) -> bool:
+        """Block until warm_up has finished; returns False on timeout"""
+        return self._warm.wait(timeout)
+    
     def get_claude_dir(self) -> Path:
         """Return the path to the Claude projects directory."""
         return self.claude_dir
@@ -127,102 +308,358 @@ class ClaudeCodeReader:
         """Round timestamp to the nearest full hour (for session start)"""
         return timestamp.replace(minute=0, second=0, microsecond=0)
     
-    def _load_usage_entries(self, hours_back: Optional[int] = None) -> List[Dict]:
-        """Load and deduplicate JSONL entries"""
+    def _load_usage_entries(self, hours_back: Optional[int] = None,
+                            track_offsets: bool = False) -> List[Dict]:
+        """Load and deduplicate JSONL entries
+        
+        Args:
+            hours_back: Only keep entries newer than this many hours (None = all)
+            track_offsets: Remember how far each file was read so later refreshes
+                can tail just the appended lines (see _tail_usage_entries)
+        """
         entries = []
-        seen_hashes: Set[str] = set()
+        seen_hashes: Set[tuple] = set()
         
         cutoff_time = None
         if hours_back:
-            cutoff_time = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=hours_back)
-        
-        # Find all JSONL files
-        jsonl_files = list(self.claude_dir.rglob("*.jsonl"))
-        logger.info(f"Loading entries from {len(jsonl_files)} JSONL files (hours_back={hours_back})")
+            cutoff_time = _utc_now() - timedelta(hours=hours_back)
+        
+        if track_offsets:
+            self._file_offsets = {}
+        
+        # Find all JSONL files. Files last written before the cutoff can't hold
+        # newer entries, so they are skipped (and count as fully read for tailing).
+        modified_after = cutoff_time.replace(tzinfo=timezone.utc).timestamp() if cutoff_time else None
+        jsonl_files = []
+        skipped = 0
+        for file_path, stat in self._iter_jsonl_files():
+            if modified_after is not None and stat.st_mtime < modified_after:
+                skipped += 1
+                if track_offsets:
+                    self._file_offsets[file_path] = (stat.st_ino, stat.st_size)
+                continue
+            jsonl_files.append((file_path, stat))
+        logger.info(f"Loading entries from {len(jsonl_files)} JSONL files, {skipped} unmodified "
+                    f"since the cutoff (hours_back={hours_back})")
+        
+        # Parse changed files concurrently, reusing cached results for the rest,
+        # then merge in file order. A file's entries are checked against the hashes
+        # of all earlier files, so the result matches reading the files one after
+        # another with a shared seen set.
+        pending = []
+        for file_path, stat in jsonl_files:
+            cached = self._get_cached_file(file_path, stat, cutoff_time)
+            if cached is None:
+                cached = self._file_executor.submit(self._parse_jsonl_file, file_path, cutoff_time)
+            pending.append((file_path, stat, cached))
         
         files_read = 0
-        for file_path in jsonl_files:
+        cache_hits = 0
+        for file_path, stat, result in pending:
+            if isinstance(result, Future):
+                try:
+                    result = result.result()
+                except Exception as e:
+                    logger.error(f"Error reading file {file_path}: {e}")
+                    continue
+                self._store_cached_file(file_path, stat, cutoff_time, result)
+            else:
+                cache_hits += 1
+            inode, file_entries, file_hashes, offset = result
+            
+            for entry in file_entries:
+                message_id = entry['message_id']
+                request_id = entry['request_id']
+                if message_id and request_id and (message_id, request_id) in seen_hashes:
+                    continue
+                entries.append(entry)
+            seen_hashes |= file_hashes
+            
+            if track_offsets:
+                self._file_offsets[file_path] = (inode, offset)
+            files_read += 1
+        
+        # Sort by timestamp
+        entries.sort(key=lambda e: e['timestamp'])
+        
+        logger.info(f"Successfully read {files_read} files ({cache_hits} unchanged and cached), "
+                    f"found {len(entries)} entries with usage data")
+        
+        return entries
+    
+    def _iter_jsonl_files(self):
+        """Yield (path, stat) for every JSONL file under claude_dir
+        
+        Walks the tree with os.scandir in the same order rglob uses: a directory's
+        files, then each subdirectory in turn. Symlinked directories aren't followed.
+        """
+        stack = [str(self.claude_dir)]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
             try:
-                with open(file_path, 'r') as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                            
+                with os.scandir(directory) as it:
+                    for entry in it:
                         try:
-                            entry = json.loads(line)
-                            
-                            # Create deduplication hash
-                            message = entry.get('message', {})
-                            message_id = entry.get('message_id') or message.get('id')
-                            request_id = entry.get('requestId') or entry.get('request_id')
-                            
-                            if message_id and request_id:
-                                unique_hash = f"{message_id}:{request_id}"
-                                if unique_hash in seen_hashes:
-                                    continue
-                                seen_hashes.add(unique_hash)
-                            
-                            # Parse timestamp
-                            timestamp_str = entry.get('timestamp')
-                            if not timestamp_str:
-                                continue
-                            
-                            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                            if timestamp.tzinfo:
-                                timestamp = timestamp.replace(tzinfo=None)
-                            
-                            # Apply time filter
-                            if cutoff_time and timestamp < cutoff_time:
-                                continue
-                            
-                            # Get entry type from raw data
-                            entry_type = entry.get('type', 'unknown')
-                            
-                            # For assistant entries, check usage data
-                            usage = message.get('usage', {})
-                            if entry_type == 'assistant' and not usage:
-                                continue
-                            
-                            # For assistant entries, must have some tokens
-                            if entry_type == 'assistant' and not any([
-                                usage.get('input_tokens', 0) > 0,
-                                usage.get('output_tokens', 0) > 0,
-                                usage.get('cache_creation_input_tokens', 0) > 0,
-                                usage.get('cache_read_input_tokens', 0) > 0
-                            ]):
-                                continue
-                            
-                            # Store processed entry
-                            entries.append({
-                                'timestamp': timestamp,
-                                'model': message.get('model', 'unknown'),
-                                'usage': usage,
-                                'message_id': message_id,
-                                'request_id': request_id,
-                                'type': entry_type,
-                                'raw': entry
-                            })
-                            
-                        except (json.JSONDecodeError, KeyError, ValueError) as e:
-                            # Expected errors: malformed JSON, missing keys, date parsing issues
-                            continue
-                        except Exception as e:
-                            # Unexpected errors should be logged
-                            logger.error(f"Unexpected error parsing entry in {file_path}: {e}")
-                            continue
-                
-                files_read += 1
-                            
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.name.endswith('.jsonl') and entry.is_file():
+                                yield Path(entry.path), entry.stat()
+                        except OSError as e:
+                            logger.error(f"Error reading file {entry.path}: {e}")
+            except OSError:
+                continue
+            stack.extend(reversed(subdirs))
+    
+    def _tail_usage_entries(self, hours_back: int) -> List[Dict]:
+        """Load only the lines appended to each JSONL file since it was last read
+        
+        New, replaced (different inode) or truncated files are read from the start.
+        """
+        entries = []
+        seen_hashes: Set[tuple] = set()
+        cutoff_time = _utc_now() - timedelta(hours=hours_back)
+        
+        file_offsets = {}
+        files_read = 0
+        for file_path, stat in self._iter_jsonl_files():
+            try:
+                inode, offset = self._file_offsets.get(file_path, (None, 0))
+                if inode != stat.st_ino or stat.st_size < offset:
+                    offset = 0
+                if stat.st_size > offset:
+                    offset = self._read_jsonl_file(file_path, offset, entries, seen_hashes, cutoff_time)
+                    files_read += 1
+                file_offsets[file_path] = (stat.st_ino, offset)
             except Exception as e:
                 logger.error(f"Error reading file {file_path}: {e}")
+                if file_path in self._file_offsets:
+                    file_offsets[file_path] = self._file_offsets[file_path]
         
-        # Sort by timestamp
-        entries.sort(key=lambda e: e['timestamp'])
+        # Files that disappeared are dropped from the offset table
+        self._file_offsets = file_offsets
         
-        logger.info(f"Successfully read {files_read} files, found {len(entries)} entries with usage data")
+        entries.sort(key=lambda e: e['timestamp'])
+        logger.debug("Tailed %d changed files, found %d new entries", files_read, len(entries))
         
         return entries
     
+    def _get_cached_file(self, file_path: Path, stat: os.stat_result,
+                         cutoff_time: Optional[datetime]) -> Optional[tuple]:
+        """Cached parse result for an unchanged file, narrowed to cutoff_time
+        
+        A result parsed with an older (or no) cutoff also serves newer cutoffs by
+        filtering its entries; the line hashes don't depend on the cutoff.
+        """
+        cached = self._file_cache.get(file_path)
+        if cached is None:
+            return None
+        mtime_ns, size, cached_cutoff, result = cached
+        if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+        result = self._narrow_result(result, cached_cutoff, cutoff_time)
+        if result is not None:
+            self._file_cache.move_to_end(file_path)
+        return result
+    
+    @staticmethod
+    def _narrow_result(result: tuple, cached_cutoff: Optional[datetime],
+                       cutoff_time: Optional[datetime]) -> Optional[tuple]:
+        """A parse result made with cached_cutoff, narrowed to cutoff_time
+        
+        Returns None when the cached cutoff is newer than the one needed.
+        """
+        if cached_cutoff is not None and (cutoff_time is None or cutoff_time < cached_cutoff):
+            return None
+        if cutoff_time is None or cutoff_time == cached_cutoff:
+            return result
+        inode, file_entries, file_hashes, offset = result
+        return inode, [e for e in file_entries if e['timestamp'] >= cutoff_time], file_hashes, offset
+    
+    def _store_cached_file(self, file_path: Path, stat: os.stat_result,
+                           cutoff_time: Optional[datetime], result: tuple) -> None:
+        """Remember a file's parse result, evicting the least recently used files"""
+        self._file_cache[file_path] = (stat.st_mtime_ns, stat.st_size, cutoff_time, result)
+        self._file_cache.move_to_end(file_path)
+        while len(self._file_cache) > self.FILE_CACHE_SIZE:
+            self._file_cache.popitem(last=False)
+    
+    def _parse_jsonl_file(self, file_path: Path, cutoff_time: Optional[datetime]) -> tuple:
+        """Parse a whole JSONL file on its own (safe to run on a worker thread)
+        
+        Returns (inode, entries, hashes of every line seen, offset read up to).
+        Unchanged files are answered from the on-disk parse cache when enabled.
+        """
+        stat = file_path.stat()
+        if self._disk_cache is not None:
+            cached = self._disk_cache.load(file_path, stat)
+            if cached is not None:
+                result = self._narrow_result(cached[1], cached[0], cutoff_time)
+                if result is not None:
+                    return (stat.st_ino,) + result[1:]
+        
+        entries = []
+        seen_hashes: Set[tuple] = set()
+        offset = self._read_jsonl_file(file_path, 0, entries, seen_hashes, cutoff_time)
+        result = (stat.st_ino, entries, seen_hashes, offset)
+        if self._disk_cache is not None:
+            self._disk_cache.store(file_path, stat, cutoff_time, result)
+        return result
+    
+    def _read_jsonl_file(self, file_path: Path, offset: int, entries: List[Dict],
+                         seen_hashes: Set[tuple], cutoff_time: Optional[datetime]) -> int:
+        """Parse a JSONL file from a byte offset, appending usage entries
+        
+        Returns the offset just past the last complete (newline-terminated) line.
+        An unterminated last line is still parsed but will be read again next time,
+        in case it is still being written.
+        """
+        # Zulu timestamps sort as text, so lines from before the cutoff can be told
+        # apart by comparing their timestamp's first 19 bytes with this
+        cutoff_prefix = cutoff_time.strftime('%Y-%m-%dT%H:%M:%S').encode() if cutoff_time else None
+        
+        with open(file_path, 'rb') as f:
+            # Map the file and slice lines out of it directly; empty files can't be
+            # mapped, so fall back to reading whatever lies past the offset
+            try:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                pos = offset
+            except (ValueError, OSError):
+                f.seek(offset)
+                data = f.read()
+                pos = 0
+            base = offset - pos
+            
+            try:
+                end = len(data)
+                while pos < end:
+                    newline = data.find(b'\n', pos)
+                    if newline == -1:
+                        line = data[pos:end]
+                        pos = end
+                    else:
+                        line = data[pos:newline]
+                        pos = newline + 1
+                        offset = base + pos
+                    
+                    # Blank lines; whitespace-only ones fail the parse below and are skipped there
+                    if len(line) < 2:
+                        continue
+                    
+                    # Lines without a timestamp (e.g. session summaries) are never kept,
+                    # and without a request id they can't mark a duplicate either
+                    if b'"timestamp"' not in line and b'"request' not in line:
+                        continue
+                    
+                    # Lines without a request id leave no duplicate hash behind, so one
+                    # whose only timestamp is before the cutoff needn't be decoded
+                    if cutoff_prefix and b'"request' not in line and line.count(b'"timestamp":') == 1:
+                        start = line.find(b'"timestamp":') + 12
+                        if line[start:start + 1] == b' ':
+                            start += 1
+                        if line[start:start + 1] == b'"':
+                            stamp = line[start + 1:line.find(b'"', start + 1)]
+                            if stamp.endswith(b'Z') and stamp[:19] < cutoff_prefix:
+                                continue
+                    
+                    try:
+                        entry = self._parse_usage_line(line, seen_hashes, cutoff_time)
+                        if entry is not None:
+                            entries.append(entry)
+                        
+                    except (_JSONDecodeError, KeyError, ValueError) as e:
+                        # Expected errors: malformed JSON, missing keys, date parsing issues
+                        continue
+                    except Exception as e:
+                        # Unexpected errors should be logged
+                        logger.error(f"Unexpected error parsing entry in {file_path}: {e}")
+                        continue
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+        
+        return offset
+    
+    def _parse_usage_line(self, line: bytes, seen_hashes: Set[tuple],
+                          cutoff_time: Optional[datetime]) -> Optional[Dict]:
+        """Parse one JSONL line into a usage entry (None if it should be skipped)"""
+        entry = _json_loads(line)
+        entry_get = entry.get
+        
+        # Create deduplication key
+        message = entry_get('message', {})
+        message_id = entry_get('message_id') or message.get('id')
+        request_id = entry_get('requestId') or entry_get('request_id')
+        
+        if message_id and request_id:
+            unique_hash = (message_id, request_id)
+            if unique_hash in seen_hashes:
+                return None
+            seen_hashes.add(unique_hash)
+        
+        # Parse timestamp
+        timestamp_str = entry_get('timestamp')
+        if not timestamp_str:
+            return None
+        
+        timestamp = _parse_timestamp(timestamp_str)
+        
+        # Apply time filter
+        if cutoff_time and timestamp < cutoff_time:
+            return None
+        
+        # Get entry type from raw data
+        entry_type = entry_get('type', 'unknown')
+        
+        # For assistant entries, check usage data
+        usage = message.get('usage', {})
+        if entry_type == 'assistant':
+            if not usage:
+                return None
+            
+            # Must have some tokens
+            usage_get = usage.get
+            if not (usage_get('input_tokens', 0) > 0 or
+                    usage_get('output_tokens', 0) > 0 or
+                    usage_get('cache_creation_input_tokens', 0) > 0 or
+                    usage_get('cache_read_input_tokens', 0) > 0):
+                return None
+        
+        # For user entries, keep only what prompt counting reads from the content
+        # so the parsed line itself isn't held onto
+        is_tool_result = False
+        text_content = ""
+        if entry_type == 'user':
+            content = message.get('content')
+            
+            # Tool results have content[0].type == 'tool_result'
+            if isinstance(content, list) and len(content) > 0:
+                first_content = content[0]
+                if isinstance(first_content, dict):
+                    if first_content.get('type') == 'tool_result':
+                        is_tool_result = True
+                    else:
+                        text_content = first_content.get('text', '')
+            elif isinstance(content, str):
+                text_content = content
+        
+        # Share one string per model name across entries
+        model = message.get('model', 'unknown')
+        if isinstance(model, str):
+            model = _MODEL_NAMES.setdefault(model, model)
+        
+        # Store processed entry
+        return {
+            'timestamp': timestamp,
+            'model': model,
+            'usage': usage,
+            'message_id': message_id,
+            'request_id': request_id,
+            'type': entry_type,
+            'is_tool_result': is_tool_result,
+            'text': text_content
+        }
+    
     def _create_session_blocks(self, entries: List[Dict]) -> List[SessionBlock]:
         """Transform entries into session blocks"""
         if not entries:
@@ -245,13 +682,13 @@ class ClaudeCodeReader:
                 
                 current_block = SessionBlock(start_time, end_time, block_id)
                 blocks.append(current_block)
-                logger.debug(f"Created session block: {block_id} ({start_time} to {end_time})")
+                logger.debug("Created session block: %s (%s to %s)", block_id, start_time, end_time)
             
             # Add entry to current block
             self._add_entry_to_block(current_block, entry)
         
         # Finalize blocks
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        now = _utc_now()
         for block in blocks:
             if block.entries:
                 block.actual_end_time = block.entries[-1]['timestamp']
@@ -264,9 +701,9 @@ class ClaudeCodeReader:
                 # Mark as active if still ongoing
                 if block.end_time > now:
                     block.is_active = True
-                    logger.debug(f"Block {block.id} marked active: ends at {block.end_time}, now is {now}")
+                    logger.debug("Block %s marked active: ends at %s, now is %s", block.id, block.end_time, now)
                 else:
-                    logger.debug(f"Block {block.id} inactive: ended at {block.end_time}, now is {now}")
+                    logger.debug("Block %s inactive: ended at %s, now is %s", block.id, block.end_time, now)
         
         # Detect and fix batch-written prompts at the beginning of sessions
         self._fix_batch_write_bug(blocks)
@@ -287,27 +724,11 @@ class ClaudeCodeReader:
             user_prompts = []
             
             for entry in block.entries:
-                if entry.get('type') == 'user':
+                if entry['type'] == 'user':
                     # Check if it's a real user prompt (not tool result)
-                    raw = entry.get('raw', {})
-                    message = raw.get('message', {})
-                    content = message.get('content')
+                    text_content = entry['text']
                     
-                    # Tool results have content[0].type == 'tool_result'
-                    is_tool_result = False
-                    text_content = ""
-                    
-                    if isinstance(content, list) and len(content) > 0:
-                        first_content = content[0]
-                        if isinstance(first_content, dict):
-                            if first_content.get('type') == 'tool_result':
-                                is_tool_result = True
-                            else:
-                                text_content = first_content.get('text', '')
-                    elif isinstance(content, str):
-                        text_content = content
-                    
-                    if not is_tool_result and text_content:
+                    if not entry['is_tool_result'] and text_content:
                         # Filter out non-English text and system messages
                         text_stripped = text_content.strip()
                         
@@ -357,7 +778,7 @@ class ClaudeCodeReader:
                 if len(prompts) > 3 and ts_key <= first_activity_buffer:
                     # This is likely a batch write at the beginning of the session
                     batch_write_count += len(prompts)
-                    logger.debug(f"Detected {len(prompts)} batch-written prompts at {ts_key} in block {block.id}")
+                    logger.debug("Detected %d batch-written prompts at %s in block %s", len(prompts), ts_key, block.id)
             
             # If we found batch writes, subtract them from the prompt count
             if batch_write_count > 0:
@@ -372,97 +793,95 @@ class ClaudeCodeReader:
                 if block.user_prompt_count > 0:
                     block.multiplication_factor = block.assistant_message_count / block.user_prompt_count
     
-    def _add_entry_to_block(self, block: SessionBlock, entry: Dict) -> None:
-        """Add entry to block and aggregate data"""
+    def _model_prices(self, model: str) -> tuple:
+        """(input, output, cache_creation, cache_read) prices per million tokens
+        
+        Looked up once per model and reused until the config reloads its pricing.
+        """
+        if self._pricing_source is not self.config.pricing:
+            self._pricing_source = self.config.pricing
+            self._pricing_cache.clear()
+        
+        prices = self._pricing_cache.get(model)
+        if prices is None:
+            pricing = self.config.get_model_pricing(model)
+            prices = (pricing['input'], pricing['output'], pricing['cache_creation'], pricing['cache_read'])
+            self._pricing_cache[model] = prices
+        return prices
+    
+    def _add_entry_to_block(self, block: SessionBlock, entry: Dict,
+                            today_midnight: Optional[datetime] = None) -> None:
+        """Add entry to block and aggregate data
+        
+        today_midnight lets callers adding many entries compute it only once.
+        """
+        # Every entry comes from _parse_usage_line, so its keys are all present
+        timestamp = entry['timestamp']
+        usage = entry['usage']
+        usage_get = usage.get
+        input_tokens = usage_get('input_tokens', 0)
+        output_tokens = usage_get('output_tokens', 0)
+        
         # Store entry for burn rate calculation (only once)
         block.entries.append(entry)
+        timestamp_us = _to_epoch_us(timestamp)
+        block.entry_timestamps.append(timestamp_us)
+        cumulative_tokens = block.cumulative_tokens
+        cumulative_tokens.append((cumulative_tokens[-1] if cumulative_tokens else 0) +
+                                 int(input_tokens or 0) + int(output_tokens or 0))
         
         # Count prompts
-        entry_type = entry.get('type', 'unknown')
+        entry_type = entry['type']
         if entry_type == 'user':
+            block.user_entry_count += 1
             # Check if this is a real user prompt or a tool result
-            raw = entry.get('raw', {})
-            message = raw.get('message', {})
-            content = message.get('content')
-            
-            # Tool results have content[0].type == 'tool_result'
-            is_tool_result = False
-            if isinstance(content, list) and len(content) > 0:
-                first_content = content[0]
-                if isinstance(first_content, dict) and first_content.get('type') == 'tool_result':
-                    is_tool_result = True
-            
-            if not is_tool_result:
-                # Also filter out interrupt messages and empty content
-                text_content = ""
-                if isinstance(content, list) and len(content) > 0:
-                    first_content = content[0]
-                    if isinstance(first_content, dict) and 'text' in first_content:
-                        text_content = first_content.get('text', '')
-                elif isinstance(content, str):
-                    text_content = content
+            if not entry['is_tool_result']:
+                # Any real user entry ends the previous prompt's run of assistant messages
+                if block.open_prompt_messages:
+                    block.prompt_message_counts.append(block.open_prompt_messages)
+                    block.open_prompt_messages = 0
                 
-                # Skip interrupt messages, empty content, system messages, and session summaries
-                skip_patterns = [
-                    "[Request interrupted",
-                    "(no content)",
-                    "Caveat: The messages below",
-                    "<user-memory-input>",
-                    "This session is being continued from a previous conversation",
-                    "Analysis:",
-                    "Summary:",
-                    "Key technical patterns:",
-                    "Important errors and fixes:",
-                    "Looking at this conversation",
-                    "Primary Request and Intent:",
-                    "Files and Code Sections:",
-                    "Problem Solving:",
-                    "Pending Tasks:",
-                    "Current Work:",
-                    "Optional Next Step:",
-                    "[Request interrupted"  # Skip interrupt messages
-                ]
+                # Also filter out interrupt messages and empty content
+                text_content = entry['text']
                 
                 # Only count if it's actual user text
                 if (text_content and 
                     text_content.strip() and  # Not just whitespace
-                    not any(text_content.startswith(skip) for skip in skip_patterns) and
+                    not text_content.startswith(self.PROMPT_SKIP_PREFIXES) and
                     len(text_content) < 500):  # Reasonable length for a user message
                     
                     # For the current session block, filter out entries from previous days
                     # to avoid counting old prompts from sessions at the same hour
                     if block.is_active:
-                        # Get today's date at midnight UTC
-                        now = datetime.now(timezone.utc).replace(tzinfo=None)
-                        today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+                        # Today's date at midnight UTC, unless the caller already worked it out
+                        if today_midnight is None:
+                            today_midnight = _utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
                         
                         # Only count entries from today for active sessions
-                        if 'timestamp' in entry and entry['timestamp'] < today_midnight:
+                        if timestamp < today_midnight:
                             # Skip entries from previous days - don't count them
                             return  # Exit this function early
                     
                     block.user_prompt_count += 1
                     # Track prompt timestamp for moving average
-                    if 'timestamp' in entry:
-                        block.prompt_timestamps.append(entry['timestamp'])
+                    insort(block.prompt_timestamps, timestamp_us)
                     
                     # Debug logging
-                    logger.debug(f"Counted user prompt #{block.user_prompt_count} at {entry.get('timestamp', 'unknown')}: {text_content[:50]}...")
+                    logger.debug("Counted user prompt #%d at %s: %s...",
+                                 block.user_prompt_count, timestamp, text_content[:50])
         elif entry_type == 'assistant':
             block.assistant_message_count += 1
+            block.open_prompt_messages += 1
         
         # For user entries, we don't have usage data
-        usage = entry.get('usage', {})
         if not usage:
             return
             
         model = entry['model']
         
         # Update token counts
-        input_tokens = usage.get('input_tokens', 0)
-        output_tokens = usage.get('output_tokens', 0)
-        cache_creation_tokens = usage.get('cache_creation_input_tokens', 0)
-        cache_read_tokens = usage.get('cache_read_input_tokens', 0)
+        cache_creation_tokens = usage_get('cache_creation_input_tokens', 0)
+        cache_read_tokens = usage_get('cache_read_input_tokens', 0)
         
         block.input_tokens += input_tokens
         block.output_tokens += output_tokens
@@ -472,11 +891,11 @@ class ClaudeCodeReader:
         block.total_tokens = block.input_tokens + block.output_tokens
         
         # Calculate cost using config pricing
-        pricing = self.config.get_model_pricing(model)
-        input_cost = (input_tokens / 1_000_000) * pricing['input']
-        output_cost = (output_tokens / 1_000_000) * pricing['output']
-        cache_creation_cost = (cache_creation_tokens / 1_000_000) * pricing['cache_creation']
-        cache_read_cost = (cache_read_tokens / 1_000_000) * pricing['cache_read']
+        input_price, output_price, cache_creation_price, cache_read_price = self._model_prices(model)
+        input_cost = (input_tokens / 1_000_000) * input_price
+        output_cost = (output_tokens / 1_000_000) * output_price
+        cache_creation_cost = (cache_creation_tokens / 1_000_000) * cache_creation_price
+        cache_read_cost = (cache_read_tokens / 1_000_000) * cache_read_price
         item_cost = input_cost + output_cost + cache_creation_cost + cache_read_cost
         
         block.cost_usd += item_cost
@@ -511,7 +930,7 @@ class ClaudeCodeReader:
             force_refresh: Force refresh even if cache is valid
             hours_back: Override hours to load (None = use default behavior)
         """
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        now = _utc_now()
         
         # Check if cache is still valid
         if not force_refresh and self._blocks_last_updated and hours_back is None:
@@ -521,16 +940,28 @@ class ClaudeCodeReader:
         # Determine how much data to load
         if hours_back is not None:
             # Explicit hours requested (e.g., for month calculation)
-            entries = self._load_usage_entries(hours_back=hours_back)
-            logger.info(f"Loading {hours_back} hours of data for session blocks")
-            # Create fresh blocks for explicit requests
-            self._session_blocks = self._create_session_blocks(entries)
+            if self._blocks_cover_since is not None and \
+                    self._blocks_cover_since <= now - timedelta(hours=hours_back):
+                # An earlier load already reaches back far enough
+                logger.debug("Reusing session blocks loaded since %s for %d hours",
+                             self._blocks_cover_since, hours_back)
+                self._merge_appended_entries()
+            else:
+                hours_back = self._load_horizon(hours_back)
+                entries = self._load_usage_entries(hours_back=hours_back)
+                logger.info(f"Loading {hours_back} hours of data for session blocks")
+                # Create fresh blocks for explicit requests
+                self._session_blocks = self._create_session_blocks(entries)
+                self._blocks_version += 1
+                self._blocks_cover_since = now - timedelta(hours=hours_back)
         elif not self._full_data_loaded:
             # First load - quick start with 24 hours
-            entries = self._load_usage_entries(hours_back=self._quick_start_hours)
+            entries = self._load_usage_entries(hours_back=self._quick_start_hours, track_offsets=True)
             self._full_data_loaded = True
             # Create initial blocks
             self._session_blocks = self._create_session_blocks(entries)
+            self._blocks_version += 1
+            self._blocks_cover_since = now - timedelta(hours=self._quick_start_hours)
             
             # Log what blocks we created
             logger.info(f"Created {len(self._session_blocks)} session blocks:")
@@ -543,25 +974,16 @@ class ClaudeCodeReader:
             cutoff_time = now - timedelta(hours=24)
             
             # Remove blocks older than 24 hours (except active ones)
+            block_count = len(self._session_blocks)
             self._session_blocks = [b for b in self._session_blocks 
                                   if b.end_time >= cutoff_time or b.is_active]
+            if len(self._session_blocks) != block_count:
+                self._blocks_version += 1
+            # Blocks holding anything newer than the cutoff end after it, so they stay
+            if self._blocks_cover_since is not None:
+                self._blocks_cover_since = max(self._blocks_cover_since, cutoff_time)
             
-            # Load only recent entries to check for updates
-            recent_entries = self._load_usage_entries(hours_back=1)
-            
-            if recent_entries:
-                # Find the latest timestamp we already have
-                latest_existing = max((e['timestamp'] for b in self._session_blocks 
-                                     for e in b.entries), default=None)
-                
-                # Only process truly new entries
-                new_entries = [e for e in recent_entries 
-                             if latest_existing is None or e['timestamp'] > latest_existing]
-                
-                if new_entries:
-                    # Add new entries to existing blocks or create new ones
-                    self._merge_new_entries(new_entries)
-                    logger.debug(f"Added {len(new_entries)} new entries to session blocks")
+            self._merge_appended_entries()
         
         self._blocks_last_updated = now
         
@@ -574,62 +996,86 @@ class ClaudeCodeReader:
         total_tokens = sum(b.total_tokens for b in self._session_blocks)
         logger.info(f"Total tokens across all blocks: {total_tokens:,}")
     
+    def _merge_appended_entries(self) -> None:
+        """Add entries appended to the JSONL files since they were last read to the blocks"""
+        # Load only lines appended since the last read to check for updates
+        recent_entries = self._tail_usage_entries(hours_back=self._quick_start_hours)
+        
+        if recent_entries:
+            # Find the latest timestamp we already have; each block's entries are
+            # in time order, so only its last one needs looking at
+            latest_existing = max((b.entries[-1]['timestamp'] for b in self._session_blocks
+                                   if b.entries), default=None)
+            
+            # Only process truly new entries
+            new_entries = [e for e in recent_entries 
+                         if latest_existing is None or e['timestamp'] > latest_existing]
+            
+            if new_entries:
+                # Add new entries to existing blocks or create new ones
+                self._merge_new_entries(new_entries)
+                self._blocks_version += 1
+                logger.debug("Added %d new entries to session blocks", len(new_entries))
+    
+    def _load_horizon(self, hours_back: int) -> int:
+        """Round an hours_back request up to the next LOAD_HORIZON_HOURS step"""
+        for horizon in self.LOAD_HORIZON_HOURS:
+            if hours_back <= horizon:
+                return horizon
+        longest = self.LOAD_HORIZON_HOURS[-1]
+        return -(-hours_back // longest) * longest
+    
     def _merge_new_entries(self, new_entries: List[Dict]) -> None:
-        """Merge new entries into existing session blocks"""
+        """Merge new entries into existing session blocks
+        
+        Blocks are sorted by start time and don't overlap, so the only block an
+        entry can belong to (or extend) is the last one starting at or before it.
+        """
         SESSION_GAP_MINUTES = 5
         
+        blocks = self._session_blocks
+        start_times = [block.start_time for block in blocks]
+        today_midnight = _utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
+        
         for entry in new_entries:
             timestamp = entry['timestamp']
             
             # Find the appropriate block for this entry
-            added = False
-            for block in self._session_blocks:
-                # Check if entry belongs to this block
-                if (block.start_time <= timestamp <= block.end_time or
-                    (block.is_active and timestamp >= block.start_time and 
-                     timestamp <= block.start_time + timedelta(hours=5))):
-                    # Add to existing block
-                    self._add_entry_to_block(block, entry)
-                    
-                    # Update block end time if needed
-                    if timestamp > block.end_time:
-                        block.end_time = timestamp
-                        # duration_minutes is a property, not an attribute - no need to set it
-                    
-                    added = True
-                    break
+            index = bisect_right(start_times, timestamp) - 1
+            block = blocks[index] if index >= 0 else None
             
-            # If not added to existing block, check if we need a new block
-            if not added:
-                # Check if this is close enough to extend an existing block
-                for block in self._session_blocks:
-                    time_since_last = (timestamp - block.end_time).total_seconds() / 60
-                    if 0 < time_since_last <= SESSION_GAP_MINUTES:
-                        # Extend existing block
-                        self._add_entry_to_block(block, entry)
-                        block.end_time = timestamp
-                        # duration_minutes is a property, not an attribute - no need to set it
-                        added = True
-                        break
+            if block is not None and (
+                    timestamp <= block.end_time or
+                    (block.is_active and timestamp <= block.start_time + timedelta(hours=5))):
+                # Add to existing block
+                self._add_entry_to_block(block, entry, today_midnight=today_midnight)
                 
-                # If still not added, create a new block
-                if not added:
-                    # Create a new block with proper constructor arguments
-                    block_id = timestamp.isoformat()
-                    new_block = SessionBlock(
-                        start_time=timestamp,
-                        end_time=timestamp + timedelta(hours=self.session_duration_hours),
-                        block_id=block_id
-                    )
-                    self._add_entry_to_block(new_block, entry)
-                    self._session_blocks.append(new_block)
-                    
-                    # Sort blocks by start time
-                    self._session_blocks.sort(key=lambda b: b.start_time)
+                # Update block end time if needed
+                if timestamp > block.end_time:
+                    block.end_time = timestamp
+                    # duration_minutes is a property, not an attribute - no need to set it
+            
+            # Check if this is close enough to extend the block
+            elif block is not None and (timestamp - block.end_time).total_seconds() / 60 <= SESSION_GAP_MINUTES:
+                # Extend existing block
+                self._add_entry_to_block(block, entry, today_midnight=today_midnight)
+                block.end_time = timestamp
+            
+            # Otherwise create a new block, keeping blocks sorted by start time
+            else:
+                block_id = timestamp.isoformat()
+                new_block = SessionBlock(
+                    start_time=timestamp,
+                    end_time=timestamp + timedelta(hours=self.session_duration_hours),
+                    block_id=block_id
+                )
+                self._add_entry_to_block(new_block, entry, today_midnight=today_midnight)
+                blocks.insert(index + 1, new_block)
+                start_times.insert(index + 1, timestamp)
         
         # Update active status for the last block
         if self._session_blocks:
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            now = _utc_now()
             last_block = self._session_blocks[-1]
             # A block is active if it's within the 5-hour window and had recent activity
             if (now - last_block.start_time).total_seconds() < 5 * 3600:
@@ -650,17 +1096,31 @@ class ClaudeCodeReader:
     def _get_current_block(self) -> Optional[SessionBlock]:
         """Get the current active session block"""
         self._update_session_blocks()
+        return self._find_current_block()
+    
+    def _find_current_block(self) -> Optional[SessionBlock]:
+        """Find the block containing the current time in the already-loaded blocks
         
+        Block end times never decrease along the list, so only the trailing
+        blocks that end after now need checking; of those, the first one
+        containing now is returned, as a forward scan would.
+        """
         # Get the current time
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        now = _utc_now()
         
         # Find the block that contains the current time
-        for block in self._session_blocks:
+        current = None
+        for block in reversed(self._session_blocks):
+            if block.end_time <= now:
+                break
             # Check if current time falls within this block's window
-            if block.start_time <= now < block.end_time:
-                logger.info(f"Found current session block: {block.id}, start={block.start_time}, "
-                          f"end={block.end_time}, prompts={block.user_prompt_count}")
-                return block
+            if block.start_time <= now:
+                current = block
+        
+        if current is not None:
+            logger.info(f"Found current session block: {current.id}, start={current.start_time}, "
+                      f"end={current.end_time}, prompts={current.user_prompt_count}")
+            return current
         
         logger.warning(f"No block found containing current time {now}")
         return None
@@ -670,7 +1130,7 @@ class ClaudeCodeReader:
         Calculate average prompts per hour from historical data.
         Returns prompts per hour or None if insufficient data.
         """
-        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=hours_back)
+        cutoff = _utc_now() - timedelta(hours=hours_back)
         
         total_prompts = 0
         total_hours = 0
@@ -678,10 +1138,7 @@ class ClaudeCodeReader:
         for block in self._session_blocks:
             if block.start_time >= cutoff and not block.is_gap:
                 # Count user prompts in this block
-                user_prompts = 0
-                for entry in block.entries:
-                    if 'raw' in entry and entry['raw'].get('type') == 'user':
-                        user_prompts += 1
+                user_prompts = block.user_entry_count
                 
                 if user_prompts > 0:
                     # Calculate block duration
@@ -698,6 +1155,14 @@ class ClaudeCodeReader:
         logger.info(f"Insufficient historical data: {total_hours:.1f} hours")
         return None
     
+    def _window_start(self, block: SessionBlock, cutoff_us: int) -> int:
+        """Index of the first block entry at or after cutoff_us (epoch microseconds)
+        
+        Block entries are appended in timestamp order, so the window is found by
+        bisecting the timestamp column.
+        """
+        return bisect_left(block.entry_timestamps, cutoff_us)
+    
     def calculate_hourly_burn_rate(self) -> float:
         """
         Calculate burn rate based on recent activity.
@@ -708,67 +1173,55 @@ class ClaudeCodeReader:
         # Update blocks to get recent data
         self._update_session_blocks()
         
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        now = _utc_now()
         one_hour_ago = now - timedelta(hours=1)
         
-        # Count tokens from ALL blocks in the last hour, not just active ones
-        hourly_input = 0
-        hourly_output = 0
-        entries_in_hour = 0
-        earliest_entry = None
-        latest_entry = None
+        two_hours_ago = now - timedelta(hours=2)
+        one_hour_ago_us = _to_epoch_us(one_hour_ago)
+        two_hours_ago_us = _to_epoch_us(two_hours_ago)
+        
+        # Count tokens from ALL blocks, not just active ones, in one pass that
+        # keeps the last hour and the hour before it apart. Each tier is
+        # [input + output tokens, entries, earliest, latest].
+        last_hour = [0, 0, None, None]
+        hour_before = [0, 0, None, None]
         
         # Check all recent blocks
         for block in self._session_blocks:
-            # Skip blocks that ended more than an hour ago
-            if block.end_time < one_hour_ago and not block.is_active:
+            # Skip blocks that ended more than two hours ago
+            if block.end_time < two_hours_ago and not block.is_active:
                 continue
-                
-            for entry in block.entries:
-                if entry['timestamp'] >= one_hour_ago:
-                    usage = entry['usage']
-                    hourly_input += usage.get('input_tokens', 0)
-                    hourly_output += usage.get('output_tokens', 0)
-                    entries_in_hour += 1
-                    
-                    # Track time range
-                    if earliest_entry is None or entry['timestamp'] < earliest_entry:
-                        earliest_entry = entry['timestamp']
-                    if latest_entry is None or entry['timestamp'] > latest_entry:
-                        latest_entry = entry['timestamp']
-        
-        hourly_tokens = hourly_input + hourly_output
-        
-        # If no entries in the last hour, try last 2 hours
-        if entries_in_hour == 0:
-            logger.info("No entries in last hour, checking last 2 hours...")
-            two_hours_ago = now - timedelta(hours=2)
             
-            for block in self._session_blocks:
-                if block.end_time < two_hours_ago and not block.is_active:
-                    continue
-                    
-                for entry in block.entries:
-                    if entry['timestamp'] >= two_hours_ago:
-                        usage = entry['usage']
-                        hourly_input += usage.get('input_tokens', 0)
-                        hourly_output += usage.get('output_tokens', 0)
-                        entries_in_hour += 1
-                        
-                        if earliest_entry is None or entry['timestamp'] < earliest_entry:
-                            earliest_entry = entry['timestamp']
-                        if latest_entry is None or entry['timestamp'] > latest_entry:
-                            latest_entry = entry['timestamp']
+            timestamps = block.entry_timestamps
+            start = self._window_start(block, two_hours_ago_us)
+            split = bisect_left(timestamps, one_hour_ago_us, start)
             
-            hourly_tokens = hourly_input + hourly_output
+            # Each window is a sorted slice, so its ends bound its time range
+            for tier, lo, hi in ((hour_before, start, split), (last_hour, split, len(timestamps))):
+                if lo == hi:
+                    continue
+                # Tokens in the window are a difference of running totals
+                cumulative = block.cumulative_tokens
+                tier[0] += cumulative[hi - 1] - (cumulative[lo - 1] if lo else 0)
+                tier[1] += hi - lo
+                if tier[2] is None or timestamps[lo] < tier[2]:
+                    tier[2] = timestamps[lo]
+                if tier[3] is None or timestamps[hi - 1] > tier[3]:
+                    tier[3] = timestamps[hi - 1]
+        
+        # If no entries in the last hour, use the last 2 hours
+        if last_hour[1] == 0:
+            logger.info("No entries in last hour, checking last 2 hours...")
+            last_hour = hour_before
+        hourly_tokens, entries_in_hour, earliest_entry, latest_entry = last_hour
         
         # If still no entries, return 0
         if entries_in_hour == 0 or earliest_entry is None or latest_entry is None:
             logger.info("No recent entries for burn rate calculation")
             return 0.0
         
-        # Calculate actual time span of entries
-        time_span_minutes = (latest_entry - earliest_entry).total_seconds() / 60.0
+        # Calculate actual time span of entries (timestamps are epoch microseconds)
+        time_span_minutes = (latest_entry - earliest_entry) / 1_000_000 / 60.0
         
         # Need at least 5 minutes of data
         if time_span_minutes < 5:
@@ -810,11 +1263,20 @@ class ClaudeCodeReader:
         return current_block.output_tokens
     
     def get_usage_data(self, since_date: Optional[datetime] = None) -> Dict:
-        """Get Claude usage data from session blocks"""
+        """Get Claude usage data from session blocks
+        
+        Results are cached per since_date. A since_date request reloads its whole
+        range, so a repeat within USAGE_CACHE_TTL seconds is answered from the cache;
+        otherwise the cache is reused while the session blocks are unchanged.
+        """
+        fresh = self._fresh_usage(since_date)
+        if fresh is not None:
+            return fresh
+        
         # If a since_date is provided, ensure we load enough data
         if since_date:
             # Calculate how many hours back we need to load
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            now = _utc_now()
             hours_needed = int((now - since_date).total_seconds() / 3600) + 24  # Add 24h buffer
             
             # Load the full date range
@@ -824,10 +1286,19 @@ class ClaudeCodeReader:
             # Update blocks with default behavior
             self._update_session_blocks()
         
-        # Filter blocks by date if needed
+        cached = self._usage_cache.get(since_date)
+        if not since_date and cached and cached[1] == self._blocks_version:
+            return copy.deepcopy(cached[2])
+        
+        # Filter blocks by date if needed. Freshly built blocks end in start order
+        # and the active ones (ending after now) are the last few, so the blocks
+        # ending before since_date are a prefix apart from any active ones at its end
         blocks = self._session_blocks
         if since_date:
-            blocks = [b for b in blocks if b.end_time >= since_date or b.is_active]
+            first = bisect_left(_BlockEndTimes(blocks), since_date)
+            while first > 0 and blocks[first - 1].is_active:
+                first -= 1
+            blocks = blocks[first:]
         
         # Aggregate data from blocks
         total_cost = 0.0
@@ -835,9 +1306,15 @@ class ClaudeCodeReader:
         total_output_tokens = 0
         total_cache_read_tokens = 0
         total_cache_creation_tokens = 0
-        model_breakdown = {}
+        model_breakdown = defaultdict(lambda: {
+            "cost": 0.0,
+            "input_tokens": 0,
+            "cache_creation_tokens": 0,
+            "cache_read_tokens": 0,
+            "output_tokens": 0,
+            "requests": 0
+        })
         session_count = len(blocks)
-        entries_processed = 0
         
         for block in blocks:
             # Add block totals
@@ -846,29 +1323,19 @@ class ClaudeCodeReader:
             total_output_tokens += block.output_tokens
             total_cache_read_tokens += block.cache_read_tokens
             total_cache_creation_tokens += block.cache_creation_tokens
-            entries_processed += len(block.entries)
             
             # Merge model breakdown
             for model, stats in block.per_model_stats.items():
-                if model not in model_breakdown:
-                    model_breakdown[model] = {
-                        "cost": 0.0,
-                        "input_tokens": 0,
-                        "cache_creation_tokens": 0,
-                        "cache_read_tokens": 0,
-                        "output_tokens": 0,
-                        "requests": 0
-                    }
-                
-                model_breakdown[model]["cost"] += stats['cost_usd']
-                model_breakdown[model]["input_tokens"] += stats['input_tokens']
-                model_breakdown[model]["cache_creation_tokens"] += stats['cache_creation_tokens']
-                model_breakdown[model]["cache_read_tokens"] += stats['cache_read_tokens']
-                model_breakdown[model]["output_tokens"] += stats['output_tokens']
-                model_breakdown[model]["requests"] += stats['entries_count']
+                totals = model_breakdown[model]
+                totals["cost"] += stats['cost_usd']
+                totals["input_tokens"] += stats['input_tokens']
+                totals["cache_creation_tokens"] += stats['cache_creation_tokens']
+                totals["cache_read_tokens"] += stats['cache_read_tokens']
+                totals["output_tokens"] += stats['output_tokens']
+                totals["requests"] += stats['entries_count']
         
         # Return aggregated data
-        return {
+        result = {
             "total_cost": total_cost,
             "total_input_tokens": total_input_tokens,
             "total_output_tokens": total_output_tokens,
@@ -876,15 +1343,44 @@ class ClaudeCodeReader:
             "total_cache_creation_tokens": total_cache_creation_tokens,
             "total_tokens": total_input_tokens + total_output_tokens,  # Non-cache tokens only
             "total_tokens_with_cache": total_input_tokens + total_output_tokens + total_cache_read_tokens + total_cache_creation_tokens,
-            "model_breakdown": model_breakdown,
+            "model_breakdown": dict(model_breakdown),
             "session_count": session_count,
             "file_count": len(blocks),  # Number of blocks
             "since_date": since_date.isoformat() if since_date else "all"
         }
+        self._usage_cache.pop(since_date, None)
+        self._usage_cache[since_date] = (time.monotonic(), self._blocks_version, result)
+        while len(self._usage_cache) > self.USAGE_CACHE_SIZE:
+            del self._usage_cache[next(iter(self._usage_cache))]
+        return copy.deepcopy(result)
+    
+    def _fresh_usage(self, since_date: Optional[datetime]) -> Optional[Dict]:
+        """Copy of a cached get_usage_data result that needs no block update, or None"""
+        cached = self._usage_cache.get(since_date)
+        if not cached:
+            return None
+        if since_date:
+            fresh = time.monotonic() - cached[0] < self.USAGE_CACHE_TTL
+        else:
+            # Same test _update_session_blocks uses to skip a refresh
+            fresh = (cached[1] == self._blocks_version and self._blocks_last_updated is not None and
+                     _utc_now() - self._blocks_last_updated < self._blocks_cache_duration)
+        return copy.deepcopy(cached[2]) if fresh else None
     
     async def get_usage_data_async(self, since_date: Optional[datetime] = None, 
                                    progress_callback: Optional[Callable[[str], None]] = None) -> Dict:
-        """Async version of get_usage_data that runs in a background thread"""
+        """Async version of get_usage_data that runs in a background thread
+        
+        A result that is still fresh in the cache is returned without a trip
+        through the executor.
+        """
+        result = self._fresh_usage(since_date)
+        if result is not None:
+            if progress_callback:
+                progress_callback("Reading Claude Code usage...")
+                progress_callback(f"Processed {result['file_count']} files")
+            return result
+        
         loop = asyncio.get_event_loop()
         
         # Create a wrapper that includes progress updates
@@ -901,10 +1397,12 @@ class ClaudeCodeReader:
     
     def get_current_session_info(self) -> Dict:
         """Get information about the current session including start time and model breakdown"""
-        # Get current block
-        current_block = self._get_current_block()
+        return self._session_info(self._get_current_block())
+    
+    def _session_info(self, current_block: Optional[SessionBlock]) -> Dict:
+        """Build session info for the given current block"""
         if not current_block:
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            now = _utc_now()
             return {
                 'start_time': self._round_to_hour(now),
                 'rate_history': [],
@@ -931,31 +1429,23 @@ class ClaudeCodeReader:
         # Ensure we have current data
         self._update_session_blocks()
         
+        # Block counters only change along with the blocks version
+        cached = self._multiplication_factor_cache
+        if cached is not None and cached[0] == self._blocks_version:
+            return dict(cached[1], model_factors=dict(cached[1]['model_factors']))
+        
         overall_prompts = 0
         overall_messages = 0
         model_stats = {}
         
         for block in self._session_blocks:
-            # Count user prompts and assistant messages in this block
-            user_prompts = 0
-            assistant_messages = 0
-            current_model = None
+            # User entries (type='user') and assistant messages (tool uses and
+            # responses), both counted as entries were added to the block
+            user_prompts = block.user_entry_count
+            assistant_messages = block.assistant_message_count
             
-            for entry in block.entries:
-                # Check type in raw data
-                if 'raw' in entry and 'type' in entry['raw']:
-                    entry_type = entry['raw']['type']
-                    
-                    # User prompts have type='user'
-                    if entry_type == 'user':
-                        user_prompts += 1
-                    # Assistant messages include tool uses and responses
-                    elif entry_type == 'assistant':
-                        assistant_messages += 1
-                        
-                # Track model from entry data
-                if 'model' in entry:
-                    current_model = entry['model']
+            # The block's model is the one its latest entry used
+            current_model = block.entries[-1]['model'] if block.entries else None
             
             # Skip blocks with no user prompts (might be incomplete)
             if user_prompts == 0:
@@ -979,49 +1469,48 @@ class ClaudeCodeReader:
             if stats['prompts'] > 0:
                 model_factors[model] = stats['messages'] / stats['prompts']
         
-        return {
+        factors = {
             'overall_factor': overall_factor,
             'model_factors': model_factors,
             'prompt_count': overall_prompts,
             'message_count': overall_messages
         }
+        self._multiplication_factor_cache = (self._blocks_version, factors)
+        return dict(factors, model_factors=dict(model_factors))
     
     def update_bounds_calculator(self):
-        """Update the adaptive bounds calculator with recent prompt data"""
+        """Update the adaptive bounds calculator with recent prompt data
+        
+        The calculator is refilled from the blocks only when they have changed
+        since it was last filled.
+        """
+        if self._bounds_calculator_version == self._blocks_version:
+            return
+        self._bounds_calculator_version = self._blocks_version
+        self._bounds_calculator.reset()
+        
         # Get recent blocks (last 24 hours)
-        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=24)
+        cutoff = _utc_now() - timedelta(hours=24)
         recent_blocks = [b for b in self._session_blocks if b.start_time >= cutoff]
         
-        # Extract individual prompt message counts
-        for block in recent_blocks:
-            current_messages = 0
-            
-            for entry in block.entries:
-                entry_type = entry.get('type', 'unknown')
-                
-                if entry_type == 'user':
-                    # Check if real user prompt
-                    raw = entry.get('raw', {})
-                    message = raw.get('message', {})
-                    content = message.get('content')
-                    
-                    is_tool_result = False
-                    if isinstance(content, list) and len(content) > 0:
-                        first_content = content[0]
-                        if isinstance(first_content, dict) and first_content.get('type') == 'tool_result':
-                            is_tool_result = True
-                    
-                    if not is_tool_result and current_messages > 0:
-                        # Previous prompt ended, record its message count
-                        self._bounds_calculator.add_prompt(current_messages)
-                        current_messages = 0
-                        
-                elif entry_type == 'assistant':
-                    current_messages += 1
-            
-            # Don't forget the last prompt in the block
-            if current_messages > 0:
-                self._bounds_calculator.add_prompt(current_messages)
+        # Message counts per prompt, kept by each block as its entries were added,
+        # with an unfinished last prompt counted as it stands. Only the newest ones
+        # fit in the calculator's window, so older blocks aren't visited at all.
+        window_size = self._bounds_calculator.window_size
+        block_counts = []
+        collected = 0
+        for block in reversed(recent_blocks):
+            counts = list(block.prompt_message_counts)
+            if block.open_prompt_messages:
+                counts.append(block.open_prompt_messages)
+            block_counts.append(counts)
+            collected += len(counts)
+            if collected >= window_size:
+                break
+        
+        prompt_counts = [count for counts in reversed(block_counts) for count in counts]
+        for message_count in prompt_counts[-window_size:]:
+            self._bounds_calculator.add_prompt(message_count)
     
     def get_session_history(self, days_back: int = 30) -> List[Dict[str, Any]]:
         """Get historical session data for the specified number of days"""
@@ -1066,65 +1555,72 @@ class ClaudeCodeReader:
         # Update calculator with recent data
         self.update_bounds_calculator()
         
+        # Reuse the last result while neither the inputs nor the blocks have changed
+        key = (plan_name, prompts_used, confidence, self._blocks_version)
+        if self._prompt_bounds_cache is not None and self._prompt_bounds_cache[0] == key:
+            return self._prompt_bounds_cache[1]
+        
         # Get message limit for plan
         plans = self.config.config.get('claude_code', {}).get('plans', {})
         plan_config = plans.get(plan_name, {})
         message_limit = plan_config.get('message_limit', 900)
         
-        return self._bounds_calculator.calculate_bounds(
+        bounds = self._bounds_calculator.calculate_bounds(
             message_limit=message_limit,
             prompts_used=prompts_used,
             confidence=confidence
         )
+        self._prompt_bounds_cache = (key, bounds)
+        return bounds
     
     def get_historical_session_maximums(self, days_back: int = 7) -> Dict[str, float]:
         """Analyze historical sessions to find maximum values for each metric
         
+        Results are reused for HISTORICAL_MAX_CACHE_TTL seconds per days_back.
+        
         Returns:
             Dict with 'max_tokens', 'max_messages', 'max_prompts' for completed sessions
         """
-        # Load session blocks for the past N days
-        old_blocks = self._session_blocks
-        self._update_session_blocks(force_refresh=True, hours_back=days_back * 24)
+        cached = self._historical_max_cache.get(days_back)
+        if cached and time.monotonic() - cached[0] < self.HISTORICAL_MAX_CACHE_TTL:
+            return dict(cached[1])
         
-        max_tokens = 0
-        max_messages = 0
-        max_prompts = 0
-        sessions_analyzed = 0
+        # Build the long-horizon blocks on the side so the live blocks are left
+        # alone; unchanged files come from the parse caches rather than disk
+        blocks = self._create_session_blocks(self._load_usage_entries(hours_back=days_back * 24))
         
-        # Analyze each completed session
-        for block in self._session_blocks:
-            # Skip active sessions and gaps
-            if block.is_active or block.is_gap:
-                continue
-                
-            # Debug log for each block
-            logger.debug(f"Historical block {block.id}: tokens={block.total_tokens}, "
-                        f"messages={block.sent_messages_count}, prompts={block.user_prompt_count}")
-                
-            # Update maximums
-            max_tokens = max(max_tokens, block.total_tokens)
-            max_messages = max(max_messages, block.sent_messages_count)
-            max_prompts = max(max_prompts, block.user_prompt_count)
-            sessions_analyzed += 1
-            
-        # Restore previous blocks to not affect current display
-        self._session_blocks = old_blocks
+        # Only completed sessions count - skip active sessions and gaps
+        completed = [block for block in blocks if not block.is_active and not block.is_gap]
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            for block in completed:
+                logger.debug("Historical block %s: tokens=%d, messages=%d, prompts=%d", block.id,
+                             block.total_tokens, block.sent_messages_count, block.user_prompt_count)
+        
+        max_tokens = max((block.total_tokens for block in completed), default=0)
+        max_messages = max((block.sent_messages_count for block in completed), default=0)
+        max_prompts = max((block.user_prompt_count for block in completed), default=0)
+        sessions_analyzed = len(completed)
         
         logger.info(f"Historical maximums (past {days_back} days): "
                    f"tokens={max_tokens}, messages={max_messages}, prompts={max_prompts}")
         
-        return {
+        result = {
             'max_tokens': max_tokens,
             'max_messages': max_messages,
             'max_prompts': max_prompts,
             'days_analyzed': days_back,
             'sessions_analyzed': sessions_analyzed
         }
+        self._historical_max_cache[days_back] = (time.monotonic(), result)
+        return dict(result)
     
     def get_current_session_prompts(self) -> Dict[str, Any]:
         """Get prompt statistics for the current session"""
-        current_block = self._get_current_block()
+        return self._session_prompts(self._get_current_block())
+    
+    def _session_prompts(self, current_block: Optional[SessionBlock]) -> Dict[str, Any]:
+        """Build prompt statistics for the given current block"""
         if not current_block:
             return {
                 'prompts_used': 0,
@@ -1140,7 +1636,33 @@ class ClaudeCodeReader:
             'pattern': self._bounds_calculator.get_current_pattern()
         }
     
-    def __del__(self):
-        """Clean up the thread pool executor"""
-        if hasattr(self, '_executor'):
-            self._executor.shutdown(wait=False)
\ No newline at end of file
+    def get_snapshot(self, plan_name: str, confidence: float = 0.8) -> Dict[str, Any]:
+        """Get everything a dashboard refresh needs from a single block update
+        
+        Equivalent to calling get_current_session_info, get_5hour_window_tokens,
+        calculate_hourly_burn_rate, get_current_session_prompts, get_prompt_bounds
+        and calculate_historical_prompt_rate, but the blocks are refreshed and the
+        current block is located only once.
+        """
+        self._update_session_blocks()
+        current_block = self._find_current_block()
+        
+        prompt_info = self._session_prompts(current_block)
+        return {
+            'session_info': self._session_info(current_block),
+            'window_tokens': current_block.total_tokens if current_block else 0,
+            'hourly_burn_rate': self.calculate_hourly_burn_rate(),
+            'prompt_info': prompt_info,
+            'prompt_bounds': self.get_prompt_bounds(plan_name, prompt_info['prompts_used'], confidence),
+            'historical_prompt_rate': self.calculate_historical_prompt_rate()
+        }
+    
+    def close(self) -> None:
+        """Shut down the reader's thread pools; safe to call more than once"""
+        self._finalizer()
+    
+    def __enter__(self) -> 'ClaudeCodeReader':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -8,6 +8,7 @@ from PyQt6.QtCore import Qt, pyqtSignal, QRect, QPoint
 from PyQt6.QtGui import QFont, QCursor, QDesktopServices, QPainter, QColor, QPen, QBrush
 from PyQt6.QtCore import QUrl
 from ..theme_manager import ThemeManager
+from ..style import set_style
 
 
 class KeyIndicator(QLabel):
@@ -176,6 +177,9 @@ class BaseProviderCard(QFrame):
         pass
         
         
+    # Skips setStyleSheet when the sheet is unchanged; see ui.style
+    set_style = staticmethod(set_style)
+            
     def update_status(self, status: str, status_type: str = "normal", use_html: bool = False):
         """Update the status label"""
         if not self.status_label:
@@ -192,15 +196,15 @@ class BaseProviderCard(QFrame):
         
         # Update status color based on type
         if status_type == "active":
-            self.status_label.setStyleSheet(f"color: #28a745; font-size: {self.base_font_sizes['small']}px;")
+            self.set_style(self.status_label, f"color: #28a745; font-size: {self.base_font_sizes['small']}px;")
         elif status_type == "warning":
-            self.status_label.setStyleSheet(f"color: #ff6b35; font-size: {self.base_font_sizes['small']}px; font-weight: bold;")
+            self.set_style(self.status_label, f"color: #ff6b35; font-size: {self.base_font_sizes['small']}px; font-weight: bold;")
         elif status_type == "error":
-            self.status_label.setStyleSheet(f"color: #dc3545; font-size: {self.base_font_sizes['small']}px;")
+            self.set_style(self.status_label, f"color: #dc3545; font-size: {self.base_font_sizes['small']}px;")
         elif status_type == "italic":
-            self.status_label.setStyleSheet(theme_manager.get_secondary_text_style(self.base_font_sizes['small'] - 2) + "; font-style: italic;")
+            self.set_style(self.status_label, theme_manager.get_secondary_text_style(self.base_font_sizes['small'] - 2) + "; font-style: italic;")
         else:
-            self.status_label.setStyleSheet(theme_manager.get_secondary_text_style(self.base_font_sizes['small']))
+            self.set_style(self.status_label, theme_manager.get_secondary_text_style(self.base_font_sizes['small']))
             
     def update_key_status(self, active_keys: int, total_keys: int):
         """Update the key indicator"""
@@ -282,7 +286,20 @@ class BaseProviderCard(QFrame):
                     self.clicked.emit(self.provider_name)
             
     def scale_fonts(self, scale: float):
-        """Scale all fonts in the card"""
+        """Scale all fonts in the card
+        
+        Every label gets a new font or stylesheet, so painting is held off until
+        the whole card has been restyled and then done once.
+        """
+        self.setUpdatesEnabled(False)
+        try:
+            self._scale_fonts(scale)
+        finally:
+            self.setUpdatesEnabled(True)
+        self.update()
+        
+    def _scale_fonts(self, scale: float):
+        """Apply the scaled title, status and content fonts"""
         # Scale title
         font = QFont()
         font.setPointSize(int(self.base_font_sizes['title'] * scale))
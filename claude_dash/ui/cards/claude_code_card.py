@@ -6,11 +6,11 @@ import os
 import logging
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from PyQt6.QtWidgets import QLabel, QProgressBar, QFrame, QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtGui import QFont, QPainter, QColor, QPen, QBrush
+from PyQt6.QtCore import Qt, QTimer, QRect
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QFontMetrics, QPalette
 from .base_card import BaseProviderCard
 from ...core.config_loader import get_config
 from ..theme_manager import ThemeManager
@@ -18,16 +18,31 @@ from ..theme_manager import ThemeManager
 logger = logging.getLogger(__name__)
 
 
+def _utc_now() -> datetime:
+    """Current time as a naive UTC datetime, matching the reader's session times"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class DualColorProgressBar(QProgressBar):
     """Progress bar that shows two colors for Opus/Sonnet ratio"""
     
     def __init__(self):
         super().__init__()
         self.opus_percentage = 50.0
+        self._shown_percentages = None  # (opus, sonnet) last passed to set_percentages
         self.setTextVisible(True)
         
+        # Painting tools are built once rather than on every repaint
+        self._background_brush = QBrush(QColor(230, 230, 230))
+        self._opus_brush = QBrush(QColor(41, 98, 255))  # Blue
+        self._sonnet_brush = QBrush(QColor(255, 106, 53))  # Orange
+        self._text_pen = QPen(QColor(0, 0, 0))
+        
     def set_percentages(self, opus_pct: float, sonnet_pct: float):
-        """Update the percentages"""
+        """Update the percentages, repainting only if they changed"""
+        if self._shown_percentages == (opus_pct, sonnet_pct):
+            return
+        self._shown_percentages = (opus_pct, sonnet_pct)
         self.opus_percentage = opus_pct
         self.setValue(100)  # Always full to show both colors
         self.setFormat(f"{int(opus_pct)}% Opus, {int(sonnet_pct)}% Sonnet")
@@ -37,25 +52,33 @@ class DualColorProgressBar(QProgressBar):
         """Custom paint to show two colors"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        rect = self.rect()
+        # Only the part Qt asked to repaint needs filling
+        damaged = event.rect()
         
         # Background
-        painter.fillRect(self.rect(), QColor(230, 230, 230))
+        painter.fillRect(damaged, self._background_brush)
         
         # Calculate split point
-        width = self.width()
+        width = rect.width()
+        height = rect.height()
         split_x = int(width * self.opus_percentage / 100)
         
         # Draw Opus portion (blue)
         if split_x > 0:
-            painter.fillRect(0, 0, split_x, self.height(), QColor(41, 98, 255))
+            opus_rect = QRect(0, 0, split_x, height).intersected(damaged)
+            if not opus_rect.isEmpty():
+                painter.fillRect(opus_rect, self._opus_brush)
         
         # Draw Sonnet portion (orange) 
         if split_x < width:
-            painter.fillRect(split_x, 0, width - split_x, self.height(), QColor(255, 106, 53))
+            sonnet_rect = QRect(split_x, 0, width - split_x, height).intersected(damaged)
+            if not sonnet_rect.isEmpty():
+                painter.fillRect(sonnet_rect, self._sonnet_brush)
             
         # Draw text on top
-        painter.setPen(QPen(QColor(0, 0, 0)))
-        painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.text())
+        painter.setPen(self._text_pen)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, self.text())
 
 
 class ClaudeCodeCard(BaseProviderCard):
@@ -84,6 +107,12 @@ class ClaudeCodeCard(BaseProviderCard):
         from ...core.bayesian_limits import BayesianLimitEstimator
         self.bayesian_estimator = BayesianLimitEstimator(self.plan_name)
         
+        # Model name -> 'opus' / 'sonnet' / 'other', classified once per name
+        self._model_families = {}
+        
+        # Inputs of the last full update_display, to skip ticks that bring nothing new
+        self._last_sig = None
+        
         self.recent_token_rates = []  # Track token usage rate
         self.hourly_burn_rate = 0.0  # Tokens per minute based on last hour
         
@@ -106,10 +135,13 @@ class ClaudeCodeCard(BaseProviderCard):
         self.progress_bar_bg = "#e0e0e0"
         self.progress_bar_text = "#000000"
         
-        # Timer to update time remaining
+        # Timer to update time remaining; single-shot, re-armed by
+        # update_time_display for when the shown minutes next change
+        self._shown_time = None  # (label text, progress value) last displayed
         self.time_update_timer = QTimer()
+        self.time_update_timer.setSingleShot(True)
         self.time_update_timer.timeout.connect(self.update_time_display)
-        self.time_update_timer.start(1000)  # Update every second
+        self.time_update_timer.start(1000)
         
     def get_font_size(self) -> int:
         """Get current font size for dynamic text"""
@@ -129,13 +161,13 @@ class ClaudeCodeCard(BaseProviderCard):
         header_layout = self.create_compact_header("Claude Code")
         self.header_value_label.setText(self.plan_display)  # Show plan in value font
         
-        # Make header fonts use secondary size
-        header_font = QFont()
+        # Make header fonts use secondary size, adjusting the fonts the labels already have
+        header_font = self.provider_label.font()
         header_font.setPointSize(self.base_font_sizes['secondary'])
         header_font.setBold(True)
         self.provider_label.setFont(header_font)
         
-        value_font = QFont()
+        value_font = self.header_value_label.font()
         value_font.setPointSize(self.base_font_sizes['secondary'])
         value_font.setBold(True)
         self.header_value_label.setFont(value_font)
@@ -181,8 +213,9 @@ class ClaudeCodeCard(BaseProviderCard):
         remaining_row.setSpacing(8)
         
         self.remaining_label = QLabel("Remaining:")
-        theme_manager = ThemeManager()
-        accent_color = theme_manager.get_accent_color('claude_code', '#ff6b35')
+        # Accent color of the current theme, refreshed in update_theme
+        self._accent_color = ThemeManager().get_accent_color('claude_code', '#ff6b35')
+        accent_color = self._accent_color
         self.remaining_label.setStyleSheet(f"font-size: {self.base_font_sizes['small']}px; color: {accent_color};")
         
         self.remaining_value = QLabel("-")
@@ -275,9 +308,10 @@ class ClaudeCodeCard(BaseProviderCard):
         self.layout.addSpacing(3)
         
         # Model legend
-        self.model_legend = QLabel('<span style="color: #2962FF;">■</span> Opus  <span style="color: #FF6A35;">■</span> Sonnet')
-        self.model_legend.setTextFormat(Qt.TextFormat.RichText)
-        self.model_legend.setStyleSheet(f"font-size: {self.base_font_sizes['small'] - 1}px;")
+        self.model_legend = QLabel()
+        self.model_legend.setAccessibleName("Opus, Sonnet")
+        self._legend_key = None  # (font px, text colour, pixel ratio) last rendered
+        self._render_model_legend(self.base_font_sizes['small'] - 1)
         self.layout.addWidget(self.model_legend)
         
         # Spacing before prediction section
@@ -309,6 +343,9 @@ class ClaudeCodeCard(BaseProviderCard):
         
     def update_display(self, data: Dict[str, Any]):
         """Update the display with usage data"""
+        # One clock reading for every time calculation in this update
+        now = _utc_now()
+        
         # Extract data
         tokens = data.get('tokens', 0)
         is_active = data.get('is_active', False)
@@ -328,8 +365,20 @@ class ClaudeCodeCard(BaseProviderCard):
         self.is_active = is_active
         self.current_tokens = tokens
         
-        # Update Bayesian estimator with historical data if available
+        # Calculate burn rates
+        burn_rates = self._calculate_burn_rates(session_start, now)
+        
+        # Nothing new since the last tick: only the status and clock need refreshing
         historical_maximums = data.get('historical_maximums')
+        sig = (tokens, self.prompts_used, self.messages_sent, is_active, session_start,
+               model_breakdown, historical_maximums, int(burn_rates['prompts']))
+        if sig == self._last_sig:
+            self._update_status_line(data, is_active)
+            self.update_time_display(now)
+            return
+        self._last_sig = sig
+        
+        # Update Bayesian estimator with historical data if available
         if historical_maximums:
             self.bayesian_estimator.update_from_session(historical_maximums)
         
@@ -337,9 +386,6 @@ class ClaudeCodeCard(BaseProviderCard):
         estimates = self.bayesian_estimator.get_estimated_limits()
         logger.info(f"Bayesian estimates: messages={estimates['messages']['estimate']:.0f}, prompts={estimates['prompts']['estimate']:.0f}")
         
-        # Calculate burn rates
-        burn_rates = self._calculate_burn_rates(session_start)
-        
         # Calculate which limit we'll hit first
         prompt_limit = estimates["prompts"]["estimate"]
         interactions_limit = prompt_limit  # For now, use prompts as interactions
@@ -384,7 +430,7 @@ class ClaudeCodeCard(BaseProviderCard):
             logger.info(f"Predictions: {predictions}")
             
             # Update prediction display
-            self._update_prediction_display(predictions)
+            self._update_prediction_display(predictions, now)
         else:
             self.prediction_label.setText("")
             self.limiting_factor_label.setText("")
@@ -395,6 +441,17 @@ class ClaudeCodeCard(BaseProviderCard):
         self.confidence_label.setText(f"{confidence_text}")
         
         # Update status
+        self._update_status_line(data, is_active)
+        
+        # Update time display
+        self.update_time_display(now)
+        
+        # Update model usage graph
+        if model_breakdown:
+            self._update_model_usage(model_breakdown)
+            
+    def _update_status_line(self, data: Dict[str, Any], is_active: bool):
+        """Show the session state and when the data was last fetched"""
         last_update = data.get('last_update', datetime.now())
         update_time_str = last_update.strftime("%H:%M:%S")
         
@@ -405,19 +462,12 @@ class ClaudeCodeCard(BaseProviderCard):
             status_text = f"No active session • Updated: {update_time_str}"
             self.update_status(status_text, "normal")
         
-        # Update time display
-        self.update_time_display()
-        
-        # Update model usage graph
-        if model_breakdown:
-            self._update_model_usage(model_breakdown)
-            
-    def _calculate_burn_rates(self, session_start) -> Dict[str, float]:
+    def _calculate_burn_rates(self, session_start, now: datetime) -> Dict[str, float]:
         """Calculate burn rates for all three metrics"""
         if not session_start or not self.is_active:
             return {"tokens": 0, "messages": 0, "prompts": 0}
             
-        elapsed = datetime.now(timezone.utc).replace(tzinfo=None) - session_start
+        elapsed = now - session_start
         hours_elapsed = elapsed.total_seconds() / 3600
         
         if hours_elapsed < 0.1:  # Less than 6 minutes
@@ -429,7 +479,7 @@ class ClaudeCodeCard(BaseProviderCard):
             "prompts": self.prompts_used / hours_elapsed
         }
         
-    def _update_prediction_display(self, predictions: Dict[str, float]):
+    def _update_prediction_display(self, predictions: Dict[str, float], now: datetime):
         """Update prediction labels based on calculated predictions"""
         time_to_limit = predictions["time_to_limit"]
         limiting_factor = predictions["limiting_factor"]
@@ -437,7 +487,7 @@ class ClaudeCodeCard(BaseProviderCard):
         # Get session remaining time
         if self.session_start_time:
             session_end = self.session_start_time + timedelta(hours=5)
-            remaining = session_end - datetime.now(timezone.utc).replace(tzinfo=None)
+            remaining = session_end - now
             session_remaining_hours = remaining.total_seconds() / 3600
         else:
             session_remaining_hours = 0
@@ -447,22 +497,20 @@ class ClaudeCodeCard(BaseProviderCard):
         # If time_to_limit < session_remaining_hours, we WILL hit the limit
         logger.info(f"Prediction: time_to_limit={time_to_limit:.1f}h, session_remaining={session_remaining_hours:.1f}h, factor={limiting_factor}")
         
-        # Get theme colors
-        theme_manager = ThemeManager()
-        accent_color = theme_manager.get_accent_color('claude_code', '#ff6b35')
+        accent_color = self._accent_color
         
         if time_to_limit >= session_remaining_hours * 3:
             self.prediction_label.setText("Very unlikely to hit any limits this session")
-            self.prediction_label.setStyleSheet(f"color: #28a745; font-size: {self.get_font_size()}px;")
+            self.set_style(self.prediction_label, f"color: #28a745; font-size: {self.get_font_size()}px;")
         elif time_to_limit >= session_remaining_hours * 1.5:
             self.prediction_label.setText("Unlikely to hit any limits this session")
-            self.prediction_label.setStyleSheet(f"font-size: {self.get_font_size()}px;")
+            self.set_style(self.prediction_label, f"font-size: {self.get_font_size()}px;")
         elif time_to_limit >= session_remaining_hours * 0.9:
             self.prediction_label.setText("Likely to hit limits this session")
-            self.prediction_label.setStyleSheet(f"color: {accent_color}; font-size: {self.get_font_size()}px; font-weight: bold;")
+            self.set_style(self.prediction_label, f"color: {accent_color}; font-size: {self.get_font_size()}px; font-weight: bold;")
         else:
             self.prediction_label.setText("Very likely to hit limits this session")
-            self.prediction_label.setStyleSheet(f"color: #dc3545; font-size: {self.get_font_size()}px; font-weight: bold;")
+            self.set_style(self.prediction_label, f"color: #dc3545; font-size: {self.get_font_size()}px; font-weight: bold;")
             
         # Set limiting factor
         factor_text = {
@@ -472,15 +520,21 @@ class ClaudeCodeCard(BaseProviderCard):
         }
         self.limiting_factor_label.setText(factor_text.get(limiting_factor, ""))
         
-    def update_time_display(self):
-        """Update time-related displays"""
-        # Use UTC time for calculations
-        now = datetime.now(timezone.utc).replace(tzinfo=None)
+    def update_time_display(self, now: Optional[datetime] = None):
+        """Update time-related displays
+        
+        Runs again when the minutes left next change, so the labels are only
+        touched when what they show differs.
+        """
+        # Use UTC time for calculations, unless the caller already read the clock
+        if now is None:
+            now = _utc_now()
         
         # Check if we have an active session
         if not self.is_active or not self.session_start_time:
-            self.time_remaining_label.setText("Time left: -")
-            self.time_progress_bar.setValue(0)
+            # Nothing ticks until update_display brings a session
+            self.time_update_timer.stop()
+            self._show_time("Time left: -", 0)
             return
             
         # Calculate times
@@ -493,13 +547,11 @@ class ClaudeCodeCard(BaseProviderCard):
         time_percentage = (elapsed.total_seconds() / session_duration.total_seconds() * 100)
         time_percentage = min(100, max(0, time_percentage))
         
-        # Update time progress bar
-        self.time_progress_bar.setValue(int(time_percentage))
-        
         # Format time remaining
-        if remaining.total_seconds() > 0:
-            hours = int(remaining.total_seconds() // 3600)
-            minutes = int((remaining.total_seconds() % 3600) // 60)
+        remaining_seconds = remaining.total_seconds()
+        if remaining_seconds > 0:
+            hours = int(remaining_seconds // 3600)
+            minutes = int((remaining_seconds % 3600) // 60)
             
             # Show next session time
             from zoneinfo import ZoneInfo
@@ -507,11 +559,22 @@ class ClaudeCodeCard(BaseProviderCard):
             local_session_end = utc_session_end.astimezone()
             next_time = local_session_end.strftime("%I:%M %p").lstrip('0')
             
-            self.time_remaining_label.setText(f"Time left: {hours}h {minutes}m • Next session: {next_time}")
+            self._show_time(f"Time left: {hours}h {minutes}m • Next session: {next_time}",
+                            int(time_percentage))
+            
+            # Wake just after the minutes left tick over
+            self.time_update_timer.start(int(remaining_seconds % 60 * 1000) + 50)
         else:
-            self.time_remaining_label.setText("Time left: Expired")
+            self._show_time("Time left: Expired", int(time_percentage))
+            self.time_update_timer.stop()
             
-        
+    def _show_time(self, text: str, progress: int):
+        """Set the time label and bar, skipping the widgets if nothing changed"""
+        if self._shown_time == (text, progress):
+            return
+        self._shown_time = (text, progress)
+        self.time_remaining_label.setText(text)
+        self.time_progress_bar.setValue(progress)
         
     def scale_content_fonts(self, scale: float):
         """Scale Claude Code specific fonts"""
@@ -519,48 +582,83 @@ class ClaudeCodeCard(BaseProviderCard):
         small_font_size = int((self.base_font_sizes['small'] - 1) * scale)
         
         # Scale interaction labels
-        self.interactions_label.setStyleSheet(f"font-size: {font_size}px;")
-        self.interactions_value.setStyleSheet(f"font-size: {font_size}px; font-weight: bold;")
-        self.remaining_label.setStyleSheet(f"font-size: {font_size}px;")
-        self.remaining_value.setStyleSheet(f"font-size: {font_size}px; font-weight: bold; color: #ff6b35;")
-        self.burn_label.setStyleSheet(f"font-size: {font_size}px;")
-        self.burn_value.setStyleSheet(f"font-size: {font_size}px;")
+        self.set_style(self.interactions_label, f"font-size: {font_size}px;")
+        self.set_style(self.interactions_value, f"font-size: {font_size}px; font-weight: bold;")
+        self.set_style(self.remaining_label, f"font-size: {font_size}px;")
+        self.set_style(self.remaining_value, f"font-size: {font_size}px; font-weight: bold; color: #ff6b35;")
+        self.set_style(self.burn_label, f"font-size: {font_size}px;")
+        self.set_style(self.burn_value, f"font-size: {font_size}px;")
         
         # Scale time labels
-        self.time_label.setStyleSheet(f"font-size: {font_size}px;")
+        self.set_style(self.time_label, f"font-size: {font_size}px;")
         
         # Scale model labels
-        self.model_label.setStyleSheet(f"font-size: {font_size}px;")
-        self.model_legend.setStyleSheet(f"font-size: {small_font_size}px;")
+        self.set_style(self.model_label, f"font-size: {font_size}px;")
+        self._render_model_legend(small_font_size)
         
         # Scale prediction labels
-        self.time_remaining_label.setStyleSheet(f"font-size: {font_size}px;")
-        self.limiting_factor_label.setStyleSheet(f"font-size: {small_font_size}px; color: #666666;")
-        self.confidence_label.setStyleSheet(f"font-size: {small_font_size}px; color: #666666;")
+        self.set_style(self.time_remaining_label, f"font-size: {font_size}px;")
+        self.set_style(self.limiting_factor_label, f"font-size: {small_font_size}px; color: #666666;")
+        self.set_style(self.confidence_label, f"font-size: {small_font_size}px; color: #666666;")
         
         # Scale prediction label with dynamic styling
         current_style = self.prediction_label.styleSheet()
         if "color: #dc3545" in current_style:  # Red
-            self.prediction_label.setStyleSheet(f"color: #dc3545; font-size: {font_size}px; font-weight: bold;")
+            self.set_style(self.prediction_label, f"color: #dc3545; font-size: {font_size}px; font-weight: bold;")
         elif "color: #ff6b35" in current_style:  # Orange
-            self.prediction_label.setStyleSheet(f"color: #ff6b35; font-size: {font_size}px; font-weight: bold;")
+            self.set_style(self.prediction_label, f"color: #ff6b35; font-size: {font_size}px; font-weight: bold;")
         elif "color: #28a745" in current_style:  # Green
-            self.prediction_label.setStyleSheet(f"color: #28a745; font-size: {font_size}px;")
+            self.set_style(self.prediction_label, f"color: #28a745; font-size: {font_size}px;")
         else:  # Default
-            self.prediction_label.setStyleSheet(f"font-size: {font_size}px; font-weight: bold;")
+            self.set_style(self.prediction_label, f"font-size: {font_size}px; font-weight: bold;")
             
     def update_theme(self):
         """Update the card when theme changes"""
         super().update_theme()  # This updates the card border
         
         # Update remaining label colors
-        theme_manager = ThemeManager()
-        accent_color = theme_manager.get_accent_color('claude_code', '#ff6b35')
-        self.remaining_label.setStyleSheet(f"font-size: {self.base_font_sizes['small']}px; color: {accent_color};")
-        self.remaining_value.setStyleSheet(f"font-size: {self.base_font_sizes['small']}px; font-weight: bold; color: {accent_color};")
+        self._accent_color = ThemeManager().get_accent_color('claude_code', '#ff6b35')
+        accent_color = self._accent_color
+        self.set_style(self.remaining_label, f"font-size: {self.base_font_sizes['small']}px; color: {accent_color};")
+        self.set_style(self.remaining_value, f"font-size: {self.base_font_sizes['small']}px; font-weight: bold; color: {accent_color};")
         
-        # Update progress bar
+        # Update progress bar and the legend's text colour
         self.model_progress_bar.update()
+        self._render_model_legend(self._legend_key[0])
+        
+    def _render_model_legend(self, font_px: int):
+        """Draw the Opus/Sonnet legend into a pixmap for the legend label
+        
+        A plain pixmap keeps the label out of Qt's rich-text layout; it is only
+        redrawn when the font size, text colour or screen pixel ratio changes.
+        """
+        self.model_legend.ensurePolished()
+        text_color = self.model_legend.palette().color(QPalette.ColorRole.WindowText)
+        ratio = self.model_legend.devicePixelRatioF()
+        key = (font_px, text_color.rgba(), ratio)
+        if key == self._legend_key:
+            return
+        self._legend_key = key
+        
+        font = self.model_legend.font()
+        font.setPixelSize(font_px)
+        metrics = QFontMetrics(font)
+        segments = (("■", QColor("#2962FF")), (" Opus  ", text_color),
+                    ("■", QColor("#FF6A35")), (" Sonnet", text_color))
+        width = sum(metrics.horizontalAdvance(text) for text, _ in segments)
+        
+        pixmap = QPixmap(max(1, round(width * ratio)), max(1, round(metrics.height() * ratio)))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        x = 0
+        for text, color in segments:
+            painter.setPen(color)
+            painter.drawText(x, metrics.ascent(), text)
+            x += metrics.horizontalAdvance(text)
+        painter.end()
+        self.model_legend.setPixmap(pixmap)
         
     def update_theme_colors(self, is_dark: bool):
         """Update progress bar colors based on theme"""
@@ -589,7 +687,7 @@ class ClaudeCodeCard(BaseProviderCard):
         else:
             chunk_color = "#28a745"  # Green
             
-        progress_bar.setStyleSheet(f"""
+        self.set_style(progress_bar, f"""
             QProgressBar {{
                 background-color: {self.progress_bar_bg};
                 text-align: center;
@@ -606,16 +704,17 @@ class ClaudeCodeCard(BaseProviderCard):
     def _update_model_usage(self, model_breakdown: Dict[str, Any]):
         """Update model usage progress bar"""
         # Calculate percentages from total session usage
-        opus_tokens = 0
-        sonnet_tokens = 0
+        tokens_by_family = {'opus': 0, 'sonnet': 0, 'other': 0}
         
         for model, stats in model_breakdown.items():
-            total_tokens = stats.get('input_tokens', 0) + stats.get('output_tokens', 0)
-            if 'opus' in model.lower():
-                opus_tokens += total_tokens
-            elif 'sonnet' in model.lower():
-                sonnet_tokens += total_tokens
-                
+            family = self._model_families.get(model)
+            if family is None:
+                family = self._model_families[model] = self._model_family(model)
+            tokens_by_family[family] += stats.get('input_tokens', 0) + stats.get('output_tokens', 0)
+        
+        opus_tokens = tokens_by_family['opus']
+        sonnet_tokens = tokens_by_family['sonnet']
+        
         total = opus_tokens + sonnet_tokens
         if total > 0:
             opus_percentage = (opus_tokens / total) * 100
@@ -627,15 +726,27 @@ class ClaudeCodeCard(BaseProviderCard):
         # Update the custom progress bar
         self.model_progress_bar.set_percentages(opus_percentage, sonnet_percentage)
     
+    @staticmethod
+    def _model_family(model: str) -> str:
+        """'opus', 'sonnet' or 'other' for a model name"""
+        name = model.lower()
+        if 'opus' in name:
+            return 'opus'
+        if 'sonnet' in name:
+            return 'sonnet'
+        return 'other'
+    
     def show_error(self, error_msg: str):
         """Display an error message on the card"""
         # Store the error state
         self.error_message = error_msg
+        # The error text replaces the prediction, so the next update must redraw it
+        self._last_sig = None
         
         # Update the UI to show error
         if hasattr(self, 'prediction_label'):
             self.prediction_label.setText(f"Error: {error_msg}")
-            self.prediction_label.setStyleSheet("color: red; font-weight: bold;")
+            self.set_style(self.prediction_label, "color: red; font-weight: bold;")
         
         # Clear the error after 10 seconds
         QTimer.singleShot(10000, self._clear_error)
@@ -644,5 +755,6 @@ class ClaudeCodeCard(BaseProviderCard):
         """Clear the error message and restore normal display"""
         if hasattr(self, 'error_message'):
             del self.error_message
+        self._last_sig = None
         if hasattr(self, 'prediction_label'):
-            self.prediction_label.setStyleSheet("")  # Reset style
+            self.set_style(self.prediction_label, "")  # Reset style
@@ -0,0 +1,811 @@
+"""
+Main window for Claude Dash: the data worker thread, title bar and theme overlay
+"""
+import os
+import logging
+import signal
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Any, Optional
+
+from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton
+from PyQt6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QEvent, QRect, QPoint, QSocketNotifier, QRunnable, QThreadPool
+)
+from PyQt6.QtGui import (
+    QKeySequence, QShortcut, QPainter, QColor, QFont, QFontMetrics, QBrush, QPen, QMouseEvent
+)
+
+from ..providers.claude_code_reader import ClaudeCodeReader
+from ..core.config_loader import get_config
+from .cards.claude_code_card import ClaudeCodeCard
+from .theme_manager import ThemeManager
+from .style import set_style
+
+logger = logging.getLogger(__name__)
+
+
+def _has_jsonl(root: str) -> bool:
+    """Whether any .jsonl file exists under root, stopping at the first one found"""
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        try:
+            for entry in it:
+                if entry.name.endswith('.jsonl') and entry.is_file():
+                    return True
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+        except OSError:
+            continue
+        finally:
+            it.close()
+    return False
+
+
+class DataUpdateWorker(QThread):
+    """Worker thread for fetching Claude data"""
+    # Typed as object so the payload is handed to the GUI thread as-is
+    data_ready = pyqtSignal(object)
+    error_occurred = pyqtSignal(str)
+    
+    # Longest time unchanged data goes without being re-sent to the card
+    MAX_EMIT_INTERVAL = timedelta(minutes=5)
+    # Bounds (seconds) for the adaptive wait between updates
+    MIN_UPDATE_INTERVAL = 10
+    MAX_UPDATE_INTERVAL = 300
+    # Length of a Claude Code session window
+    SESSION_DURATION = timedelta(hours=5)
+    # Seconds between historical-maximum refreshes
+    HISTORICAL_UPDATE_INTERVAL = 3600
+    
+    def __init__(self, reader: Optional[ClaudeCodeReader] = None):
+        super().__init__()
+        # Either a reader already warming up elsewhere, or None to create one in the worker thread
+        self.reader = reader
+        self.running = True
+        # Get update frequency from config
+        self.config = get_config()
+        self.update_frequency = self.config.get_ui_config().get('update_frequency_seconds', 30)
+        # Current wait between updates, adapted around update_frequency
+        self._interval = self.update_frequency
+        self._min_interval = min(self.MIN_UPDATE_INTERVAL, self.update_frequency)
+        self._max_interval = max(self.MAX_UPDATE_INTERVAL, self.update_frequency)
+        # Resolved on the worker thread (auto-detection reads usage history) and
+        # re-resolved together with the hourly historical maximums
+        self.plan_name = None
+        self.historical_maximums = None
+        self.last_historical_update = None  # time.monotonic() of the last refresh
+        # Set to cut the wait between updates short (e.g. on stop)
+        self._wake = threading.Event()
+        # Cleared while the window is hidden or minimized so no data is fetched
+        self._active = True
+        # What the card last received, so unchanged refreshes are not re-emitted
+        self._last_emitted_key = None
+        self._last_emit_time = None
+        
+    def run(self):
+        """Run the data fetching loop"""
+        if self.reader is None:
+            # Create the reader in the worker thread to avoid race conditions
+            self.reader = ClaudeCodeReader()
+        else:
+            # Handed a reader that is warming up - it is ours once that finishes
+            self.reader.wait_until_warm()
+        
+        while self.running:
+            if not self._active:
+                # Nobody can see the card - sleep until shown again or stopped
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            
+            try:
+                data = self.fetch_claude_data()
+                if data and self._should_emit(data):
+                    self.data_ready.emit(data)
+            except Exception as e:
+                logger.error("Error fetching Claude data: %s", e)
+                self.error_occurred.emit(str(e))
+            
+            # Wait before next update (update_frequency, adapted to activity)
+            self._wake.wait(self._interval)
+            self._wake.clear()
+    
+    def fetch_claude_data(self) -> Dict[str, Any]:
+        """Fetch Claude usage data"""
+        if self.plan_name is None:
+            self.plan_name = self.config.get_subscription_plan()
+        
+        # Session info, window tokens, burn rate, prompts, prompt bounds (80% confidence)
+        # and historical prompt rate in one pass over the session blocks
+        snapshot = self.reader.get_snapshot(self.plan_name, confidence=0.8)
+        session_info = snapshot['session_info']
+        session_start = session_info['start_time']
+        window_tokens = snapshot['window_tokens']
+        hourly_burn_rate = snapshot['hourly_burn_rate']
+        prompt_info = snapshot['prompt_info']
+        prompt_bounds = snapshot['prompt_bounds']
+        historical_prompt_rate = snapshot['historical_prompt_rate']
+        
+        # Check if currently active (convert to UTC for comparison)
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        is_active = session_start <= now <= session_start + self.SESSION_DURATION
+        
+        # Update historical maximums periodically (every hour)
+        if (self.last_historical_update is None or 
+            time.monotonic() - self.last_historical_update > self.HISTORICAL_UPDATE_INTERVAL):
+            try:
+                self.historical_maximums = self.reader.get_historical_session_maximums(days_back=7)
+                self.last_historical_update = time.monotonic()
+                self.plan_name = None  # Pick up plan changes on the next fetch
+                logger.info("Updated historical maximums: %s", self.historical_maximums)
+            except Exception as e:
+                logger.error("Failed to get historical maximums: %s", e)
+        
+        result = {
+            'tokens': window_tokens,
+            'is_active': is_active,
+            'session_start': session_start,
+            # The block's per-model stats keep changing on this thread; the card
+            # gets its own copy rather than a view shared with the reader
+            'model_breakdown': {model: dict(stats) for model, stats
+                                in session_info.get('model_breakdown', {}).items()},
+            'hourly_burn_rate': hourly_burn_rate,
+            'prompt_info': {
+                'prompts_used': prompt_info['prompts_used'],
+                'messages_sent': prompt_info['messages_sent'],
+                'multiplication_factor': prompt_info['multiplication_factor'],
+                'prompt_bounds': prompt_bounds,
+                'historical_prompt_rate': historical_prompt_rate,
+                'moving_average_rate': session_info.get('moving_average_rate')
+            },
+            'historical_maximums': self.historical_maximums,
+            'last_update': datetime.now()
+        }
+        
+        logger.info("Session check: active=%s, prompts=%s", is_active, prompt_info['prompts_used'])
+        
+        return result
+    
+    def _should_emit(self, data: Dict[str, Any]) -> bool:
+        """Whether data differs from what the card last received
+        
+        Unchanged data is still re-sent every MAX_EMIT_INTERVAL so time-based
+        parts of the card (elapsed-time burn rates, predictions) don't go stale.
+        Also adapts the polling interval: it grows while nothing changes and
+        shrinks again once usage moves.
+        """
+        prompt_info = data['prompt_info']
+        key = (
+            data['tokens'],
+            data['is_active'],
+            data['session_start'],
+            data['hourly_burn_rate'],
+            prompt_info['prompts_used'],
+            prompt_info['messages_sent'],
+            prompt_info['prompt_bounds'],
+            prompt_info['historical_prompt_rate'],
+            prompt_info['moving_average_rate'],
+            data['historical_maximums'],
+        )
+        now = data['last_update']
+        if key == self._last_emitted_key:
+            # Idle: back off multiplicatively
+            self._interval = min(self._max_interval, self._interval * 1.5)
+            if self._last_emit_time is not None and now - self._last_emit_time < self.MAX_EMIT_INTERVAL:
+                logger.debug("Data unchanged since last update, not re-emitting "
+                             "(next check in %.0fs)", self._interval)
+                return False
+        else:
+            # Usage is moving: poll more often
+            self._interval = max(self._min_interval, self._interval * 0.7)
+        
+        self._last_emitted_key = key
+        self._last_emit_time = now
+        return True
+    
+    def set_active(self, active: bool):
+        """Pause or resume fetching; resuming triggers an immediate refresh"""
+        was_active = self._active
+        self._active = active
+        if active and not was_active:
+            self._interval = self.update_frequency
+            self._wake.set()
+    
+    def stop(self):
+        """Stop the worker thread"""
+        self.running = False
+        self._wake.set()
+        self.wait()
+
+
+class CustomTitleBar(QWidget):
+    """Custom title bar with minimal height"""
+    
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.parent = parent
+        self.setFixedHeight(18)  # Ultra-compact height
+        self.setAutoFillBackground(True)
+        
+        # For window dragging
+        self.mouse_pressed = False
+        self.drag_position = QPoint()
+        
+        self.init_ui()
+        
+    def init_ui(self):
+        """Initialize title bar UI"""
+        # Don't use a layout - position elements absolutely
+        
+        # Title label (truly centered in the window)
+        self.title_label = QLabel("Claude Dash", self)
+        self.title_label.setStyleSheet("font-size: 10px; color: #888888;")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # We'll position it in resizeEvent to keep it centered
+        
+        # Minimize button (positioned on the right)
+        self.minimize_btn = QPushButton("─", self)
+        self.minimize_btn.setFixedSize(16, 16)
+        self.minimize_btn.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                color: #888888;
+                font-size: 10px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: rgba(128, 128, 128, 0.2);
+                border-radius: 3px;
+            }
+        """)
+        self.minimize_btn.clicked.connect(self.parent.showMinimized)
+        
+        # Close button (positioned on the right)
+        self.close_btn = QPushButton("×", self)
+        self.close_btn.setFixedSize(16, 16)
+        self.close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: transparent;
+                border: none;
+                color: #888888;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #e81123;
+                color: white;
+                border-radius: 3px;
+            }
+        """)
+        self.close_btn.clicked.connect(self.parent.close)
+        
+    def resizeEvent(self, event):
+        """Position elements when widget is resized"""
+        super().resizeEvent(event)
+        
+        # Center the title label in the full width
+        self.title_label.resize(self.width(), self.height())
+        self.title_label.move(0, 0)
+        
+        # Position buttons on the right
+        button_y = (self.height() - 16) // 2
+        self.close_btn.move(self.width() - 20, button_y)
+        self.minimize_btn.move(self.width() - 40, button_y)
+        
+    def update_theme(self, stylesheets: Dict[str, str]):
+        """Update title bar colors from the theme's cached style sheets"""
+        set_style(self, stylesheets['title_bar'])
+        set_style(self.title_label, stylesheets['title_label'])
+        set_style(self.minimize_btn, stylesheets['minimize_button'])
+        set_style(self.close_btn, stylesheets['close_button'])
+        
+    def mousePressEvent(self, event: QMouseEvent):
+        """Handle mouse press for dragging"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.mouse_pressed = True
+            self.drag_position = event.globalPosition().toPoint() - self.parent.frameGeometry().topLeft()
+            event.accept()
+            
+    def mouseMoveEvent(self, event: QMouseEvent):
+        """Handle mouse move for dragging"""
+        if self.mouse_pressed and event.buttons() == Qt.MouseButton.LeftButton:
+            self.parent.move(event.globalPosition().toPoint() - self.drag_position)
+            event.accept()
+            
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        """Handle mouse release"""
+        self.mouse_pressed = False
+        event.accept()
+
+
+class SaveConfigTask(QRunnable):
+    """Writes the config file off the GUI thread"""
+    
+    def __init__(self, config):
+        super().__init__()
+        self._config = config
+    
+    def run(self):
+        self._config.save_config()
+
+
+class ClaudeDashWindow(QMainWindow):
+    """Simplified main window focused on session tracking"""
+    
+    # How long scale changes are collected before the window is re-laid out
+    SCALE_APPLY_DELAY_MS = 150
+    # Quiet period after the last settings change before the config is written
+    CONFIG_SAVE_DELAY_MS = 2000
+    
+    def __init__(self):
+        super().__init__()
+        self.data_worker = None
+        
+        # Theme manager
+        self.theme_manager = ThemeManager()
+        
+        # Theme selector state
+        self.theme_selector_active = False
+        self.theme_selector_first_press = True
+        self.theme_preview_index = 0
+        self.original_theme = None
+        self.theme_overlay = None
+        
+        # Load UI settings from config
+        self.config = get_config()
+        ui_config = self.config.config.get('ui', {})
+        
+        # Load saved theme
+        saved_theme = ui_config.get('theme', None)
+        if saved_theme and saved_theme in self.theme_manager.THEMES:
+            self.theme_manager.set_theme(saved_theme)
+        
+        # Load saved scale
+        self.scale_factor = ui_config.get('scale', 1.0)
+        self.font_scale = self.scale_factor
+        
+        # Scale steps from held Ctrl+/Ctrl- keys are coalesced and applied together
+        self._pending_scale = None
+        self._scale_timer = QTimer(self)
+        self._scale_timer.setSingleShot(True)
+        self._scale_timer.setInterval(self.SCALE_APPLY_DELAY_MS)
+        self._scale_timer.timeout.connect(self._apply_pending_scale)
+        
+        # Settings changes are written to disk once things settle, off the GUI thread
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(self.CONFIG_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._save_config_async)
+        # One thread of its own, so saves never overlap and exit only waits for them
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        
+        self.init_ui()
+        self.check_data_source_and_launch()
+        
+    def init_ui(self):
+        """Initialize the user interface"""
+        # Make window frameless
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
+        
+        # Card size: 260x240 with 5px border
+        card_width = 260
+        card_height = 240
+        border = 5
+        title_bar_height = 18
+        base_width = card_width + (2 * border)  # 270
+        base_height = title_bar_height + card_height + (2 * border)  # 275 (25 + 250)
+        self.setFixedSize(int(base_width * self.scale_factor), int(base_height * self.scale_factor))
+
+        # Create main widget that contains title bar and content
+        main_widget = QWidget()
+        self.setCentralWidget(main_widget)
+        
+        # Main vertical layout (no margins)
+        main_layout = QVBoxLayout(main_widget)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setSpacing(0)
+        
+        # Add custom title bar
+        self.title_bar = CustomTitleBar(self)
+        main_layout.addWidget(self.title_bar)
+        
+        # Create content widget with margins
+        content_widget = QWidget()
+        content_layout = QVBoxLayout(content_widget)
+        # 5px margin all around
+        margin = int(border * self.scale_factor)
+        content_layout.setContentsMargins(margin, margin, margin, margin)
+        content_layout.setSpacing(0)  # No spacing between widgets
+        
+        # Create a larger, focused Claude Code card
+        self.claude_card = ClaudeCodeCard(scale_factor=self.scale_factor)
+        # Set card to exact size
+        self.claude_card.setMinimumSize(card_width, card_height)
+        self.claude_card.setMaximumSize(card_width, card_height)
+        content_layout.addWidget(self.claude_card)
+        
+        # Add content widget to main layout
+        main_layout.addWidget(content_widget)
+        
+        # Apply theme
+        self.apply_theme(self.theme_manager.current_theme)
+        
+        # Setup keyboard shortcuts
+        self.setup_shortcuts()
+        
+    def check_data_source_and_launch(self):
+        """Check if Claude data directory exists and contains data"""
+        # Get Claude directory from config
+        claude_dir = self.config.get_claude_data_path()
+        
+        # Check if directory exists and contains any .jsonl files
+        if not claude_dir.exists() or not _has_jsonl(str(claude_dir)):
+            self.show_data_error(str(claude_dir))
+        else:
+            self.init_data_worker()
+
+    def show_data_error(self, path: str):
+        """Display an error message about the missing data source"""
+        error_widget = QWidget()
+        error_layout = QVBoxLayout(error_widget)
+        
+        error_label = QLabel(
+            f'<h3>Could not find Claude Code data</h3>'
+            f'<p>Looking in: {path}</p>'
+            f'<p>Please ensure Claude Code is installed and has been used.</p>'
+        )
+        error_label.setWordWrap(True)
+        error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        error_layout.addWidget(error_label)
+        
+        self.setCentralWidget(error_widget)
+        
+    def init_data_worker(self):
+        """Initialize the data update worker"""
+        # Start loading session blocks on the thread pool right away, so the
+        # first fetch finds them ready
+        reader = ClaudeCodeReader()
+        QThreadPool.globalInstance().start(reader.warm_up)
+        self.data_worker = DataUpdateWorker(reader)
+        self.data_worker.data_ready.connect(self.on_data_ready)
+        self.data_worker.error_occurred.connect(self.on_error)
+        self.data_worker.start()
+        
+    def on_data_ready(self, data: Dict[str, Any]):
+        """Handle new data from the worker thread"""
+        # Update Claude card
+        self.claude_card.update_display(data)
+        
+    def on_error(self, error_msg: str):
+        """Handle errors from the worker thread"""
+        logger.error(f"Data worker error: {error_msg}")
+        # Show error in UI
+        if hasattr(self, 'claude_card'):
+            self.claude_card.show_error(f"Error updating data: {error_msg}")
+        
+    def setup_shortcuts(self):
+        """Setup keyboard shortcuts"""
+        # Command+Q to quit
+        quit_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
+        quit_shortcut.activated.connect(self.close)
+        
+        # Command+W to close window
+        close_shortcut = QShortcut(QKeySequence("Ctrl+W"), self)
+        close_shortcut.activated.connect(self.close)
+        
+        # T for theme switching
+        theme_shortcut = QShortcut(QKeySequence("T"), self)
+        theme_shortcut.activated.connect(self.handle_theme_key)
+        
+        # Enter to accept theme
+        enter_shortcut = QShortcut(QKeySequence("Return"), self)
+        enter_shortcut.activated.connect(self.accept_theme)
+        
+        # ESC to cancel theme selection
+        esc_shortcut = QShortcut(QKeySequence("Escape"), self)
+        esc_shortcut.activated.connect(self.cancel_theme_selection)
+        
+        # +/- for scaling
+        scale_up = QShortcut(QKeySequence("Ctrl++"), self)
+        scale_up.activated.connect(lambda: self.adjust_scale(0.05))
+        
+        scale_down = QShortcut(QKeySequence("Ctrl+-"), self)
+        scale_down.activated.connect(lambda: self.adjust_scale(-0.05))
+        
+    def handle_theme_key(self):
+        """Handle T key press for theme selection"""
+        if not self.theme_selector_active:
+            # First press - show current theme
+            self.theme_selector_active = True
+            self.theme_selector_first_press = True
+            self.original_theme = self.theme_manager.current_theme
+            themes = self.theme_manager.get_available_themes()
+            self.theme_preview_index = themes.index(self.original_theme)
+            self.show_theme_overlay(self.original_theme)
+        elif self.theme_selector_first_press:
+            # Second press - start cycling
+            self.theme_selector_first_press = False
+            self.cycle_theme_preview()
+        else:
+            # Subsequent presses - continue cycling
+            self.cycle_theme_preview()
+    
+    def cycle_theme_preview(self):
+        """Cycle through themes in preview mode"""
+        themes = self.theme_manager.get_available_themes()
+        self.theme_preview_index = (self.theme_preview_index + 1) % len(themes)
+        next_theme = themes[self.theme_preview_index]
+        self.apply_theme(next_theme)
+        self.show_theme_overlay(next_theme)
+    
+    def accept_theme(self):
+        """Accept the currently previewed theme"""
+        if self.theme_selector_active:
+            self.theme_selector_active = False
+            self.theme_selector_first_press = True
+            self.hide_theme_overlay()
+            # Save theme to config
+            self.config.config.setdefault('ui', {})['theme'] = self.theme_manager.current_theme
+            self.schedule_config_save()
+    
+    def cancel_theme_selection(self):
+        """Cancel theme selection and revert to original"""
+        if self.theme_selector_active:
+            self.theme_selector_active = False
+            self.theme_selector_first_press = True
+            self.hide_theme_overlay()
+            # Revert to original theme
+            if self.original_theme:
+                self.apply_theme(self.original_theme)
+    
+    def show_theme_overlay(self, theme_name: str):
+        """Show theme name overlay"""
+        if not self.theme_overlay:
+            self.theme_overlay = ThemeOverlay(self)
+        self.theme_overlay.set_theme_name(theme_name)
+        self.theme_overlay.resize(self.size())
+        self.theme_overlay.show()
+    
+    def hide_theme_overlay(self):
+        """Hide theme overlay"""
+        if self.theme_overlay:
+            self.theme_overlay.hide()
+        
+    def apply_theme(self, theme_name: str):
+        """Apply a theme to the application"""
+        self.theme_manager.set_theme(theme_name)
+        stylesheets = self.theme_manager.get_window_stylesheets()
+        
+        # Apply to main window
+        set_style(self, stylesheets['main_window'])
+        
+        # Update title bar
+        if hasattr(self, 'title_bar'):
+            self.title_bar.update_theme(stylesheets)
+        
+        # Update cards
+        if hasattr(self, 'claude_card'):
+            self.claude_card.update_theme()
+            
+    def adjust_scale(self, delta: float):
+        """Adjust UI scale"""
+        current = self._pending_scale if self._pending_scale is not None else self.scale_factor
+        new_scale = current + delta
+        if 0.75 <= new_scale <= 2.0:
+            self._pending_scale = new_scale
+            if not self._scale_timer.isActive():
+                self._scale_timer.start()
+    
+    def _apply_pending_scale(self):
+        """Resize the window and card for the latest requested scale"""
+        if self._pending_scale is None:
+            return
+        self.scale_factor = self._pending_scale
+        self.font_scale = self._pending_scale
+        self._pending_scale = None
+        
+        # Save scale to config
+        self.config.config.setdefault('ui', {})['scale'] = self.scale_factor
+        self.schedule_config_save()
+        
+        # Resize window - keep consistent with init_ui
+        card_width = 260
+        card_height = 240
+        border = 5
+        title_bar_height = 18
+        base_width = card_width + (2 * border)  # 270
+        base_height = title_bar_height + card_height + (2 * border)  # 275
+        self.setFixedSize(int(base_width * self.scale_factor), int(base_height * self.scale_factor))
+        
+        # Update card
+        self.claude_card.scale_fonts(self.scale_factor)
+            
+    def schedule_config_save(self):
+        """Save the config after CONFIG_SAVE_DELAY_MS without further changes"""
+        self._save_timer.start()
+    
+    def _save_config_async(self):
+        """Write the config on the save pool's thread"""
+        self._save_pool.start(SaveConfigTask(self.config))
+    
+    def showEvent(self, event):
+        """Resume data updates when the window becomes visible"""
+        super().showEvent(event)
+        if self.data_worker:
+            self.data_worker.set_active(not self.isMinimized())
+    
+    def hideEvent(self, event):
+        """Pause data updates while the window is hidden"""
+        super().hideEvent(event)
+        if self.data_worker:
+            self.data_worker.set_active(False)
+    
+    def changeEvent(self, event):
+        """Pause data updates while minimized"""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange and self.data_worker:
+            self.data_worker.set_active(self.isVisible() and not self.isMinimized())
+    
+    def closeEvent(self, event):
+        """Handle window close event"""
+        self.cleanup()
+        event.accept()
+    
+    def cleanup(self):
+        """Clean up resources before exit"""
+        # Let any in-flight settings write finish, then flush a pending save;
+        # saving before the wait could interleave two writes to the same file
+        pending_save = self._save_timer.isActive()
+        self._save_timer.stop()
+        self._save_pool.waitForDone()
+        if pending_save:
+            self.config.save_config()
+        
+        if self.data_worker:
+            logger.info("Stopping data worker...")
+            self.data_worker.stop()
+            self.data_worker.wait()  # Wait for thread to finish
+            if self.data_worker.reader:
+                self.data_worker.reader.close()
+            self.data_worker.deleteLater()  # Schedule for deletion
+            self.data_worker = None
+
+
+def setup_signal_handlers(window, app):
+    """Setup signal handlers for graceful shutdown"""
+    def signal_handler(signum, frame):
+        logger.info(f"Received signal {signum}, shutting down gracefully...")
+        # Close the window, which triggers cleanup
+        if window:
+            window.close()
+        # Quit the application
+        app.quit()
+    
+    # Handle Ctrl-C (SIGINT) and termination signals
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+    
+    # Python only runs signal handlers between bytecodes, which never happens while
+    # Qt sits idle in its native event loop. Route the signal's wakeup byte
+    # through a pipe Qt watches, so the loop wakes exactly when a signal arrives.
+    def polling_timer():
+        timer = QTimer()
+        timer.timeout.connect(lambda: None)  # Process events
+        timer.start(100)  # Check every 100ms
+        return timer
+    
+    # On Windows the wakeup fd must be a socket (and os.set_blocking is missing
+    # before Python 3.12), so poll for signals there instead
+    if os.name == 'nt':
+        return polling_timer()
+    
+    read_fd = write_fd = None
+    try:
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+    except (OSError, ValueError, AttributeError) as e:
+        logger.debug("Signal wakeup fd unavailable (%s), polling for signals instead", e)
+        for fd in (read_fd, write_fd):
+            if fd is not None:
+                os.close(fd)
+        return polling_timer()
+    
+    def drain_wakeup_fd():
+        try:
+            while os.read(read_fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+    
+    notifier = QSocketNotifier(read_fd, QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(drain_wakeup_fd)
+    return notifier
+
+
+class ThemeOverlay(QWidget):
+    """Overlay widget to display theme name"""
+    
+    INSTRUCTIONS = (
+        "T: cycle",
+        "Enter: accept",
+        "ESC: cancel"
+    )
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.theme_name = ""
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setWindowFlags(Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
+        
+        # Fonts, colors and text widths don't change between repaints (which come
+        # in quick succession while cycling themes), so they are built once
+        self._title_font = QFont()
+        self._title_font.setPointSize(14)
+        self._title_font.setBold(True)
+        self._small_font = QFont()
+        self._small_font.setPointSize(10)
+        self._background_brush = QBrush(QColor(250, 250, 250, 180))  # Light background
+        self._border_pen = QPen(QColor(200, 200, 200, 200), 1)  # Subtle border
+        self._title_color = QColor(50, 50, 50)  # Dark text on light background
+        self._instruction_color = QColor(100, 100, 100)  # Lighter text for instructions
+        
+        small_metrics = QFontMetrics(self._small_font, self)
+        self._instruction_widths = [small_metrics.boundingRect(text).width()
+                                    for text in self.INSTRUCTIONS]
+        self._title_width = 0
+        
+    def set_theme_name(self, name: str):
+        """Set the theme name to display"""
+        self.theme_name = name
+        self._title_width = QFontMetrics(self._title_font, self).boundingRect(name).width()
+        self.update()
+        
+    def paintEvent(self, event):
+        """Paint the overlay"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        # Create a rounded rectangle for the overlay
+        overlay_width = 160
+        overlay_height = 90
+        margin = 10
+        
+        # Position at bottom center
+        overlay_rect = QRect(
+            (self.width() - overlay_width) // 2,
+            self.height() - overlay_height - margin,
+            overlay_width,
+            overlay_height
+        )
+        center_x = overlay_rect.center().x()
+        
+        # Draw semi-transparent white/gray background with rounded corners
+        painter.setBrush(self._background_brush)
+        painter.setPen(self._border_pen)
+        painter.drawRoundedRect(overlay_rect, 8, 8)
+        
+        # Theme name
+        painter.setFont(self._title_font)
+        painter.setPen(self._title_color)
+        painter.drawText(center_x - self._title_width // 2, overlay_rect.top() + 25, self.theme_name)
+        
+        # Draw instructions in smaller text
+        painter.setFont(self._small_font)
+        painter.setPen(self._instruction_color)
+        
+        y = overlay_rect.top() + 45
+        for instruction, width in zip(self.INSTRUCTIONS, self._instruction_widths):
+            painter.drawText(center_x - width // 2, y, instruction)
+            y += 15  # Compact line spacing
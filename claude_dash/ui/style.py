@@ -0,0 +1,14 @@
+"""
+Stylesheet helpers shared by the window and the cards
+"""
+from PyQt6.QtWidgets import QWidget
+
+
+def set_style(widget: QWidget, style: str) -> None:
+    """Apply a stylesheet unless the widget already has it
+    
+    setStyleSheet re-parses the sheet and re-polishes the widget even when
+    nothing changed, so refresh paths go through here.
+    """
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
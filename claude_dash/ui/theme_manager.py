@@ -201,6 +201,8 @@ class ThemeManager(QObject):
         super().__init__()
         self.current_theme = default_theme
         self.theme_data = self.THEMES.get(default_theme, self.THEMES["dark"])
+        # Window and title bar style sheets per theme name, built on first use
+        self._stylesheet_cache: Dict[str, Dict[str, str]] = {}
         self._initialized = True
         
     def set_theme(self, theme_name: str):
@@ -225,6 +227,67 @@ class ThemeManager(QObject):
         """Get list of available theme names"""
         return list(self.THEMES.keys())
     
+    def get_window_stylesheets(self) -> Dict[str, str]:
+        """Get the main window and title bar style sheets for the current theme
+        
+        Each theme's sheets are formatted once and reused, so cycling through
+        themes doesn't rebuild them on every keypress.
+        
+        Returns:
+            Dict with 'main_window', 'title_bar', 'title_label',
+            'minimize_button' and 'close_button' style sheets
+        """
+        sheets = self._stylesheet_cache.get(self.current_theme)
+        if sheets is None:
+            sheets = self._build_window_stylesheets(self.theme_data)
+            self._stylesheet_cache[self.current_theme] = sheets
+        return sheets
+    
+    @staticmethod
+    def _build_window_stylesheets(theme: Dict[str, Any]) -> Dict[str, str]:
+        """Format the window and title bar style sheets for a theme"""
+        bg_color = theme.get('card_background', '#2d2d2d')
+        text_color = theme.get('text_secondary', '#888888')
+        
+        return {
+            'main_window': f"""
+            QMainWindow {{
+                background-color: {theme['background']};
+            }}
+            QLabel {{
+                color: {theme['text_primary']};
+            }}
+        """,
+            'title_bar': f"background-color: {bg_color};",
+            'title_label': f"font-size: 10px; color: {text_color};",
+            'minimize_button': f"""
+            QPushButton {{
+                background-color: transparent;
+                border: none;
+                color: {text_color};
+                font-size: 10px;
+                font-weight: bold;
+            }}
+            QPushButton:hover {{
+                background-color: rgba(128, 128, 128, 0.2);
+                border-radius: 3px;
+            }}
+        """,
+            'close_button': f"""
+            QPushButton {{
+                background-color: transparent;
+                border: none;
+                color: {text_color};
+                font-size: 14px;
+            }}
+            QPushButton:hover {{
+                background-color: #e81123;
+                color: white;
+                border-radius: 3px;
+            }}
+        """,
+        }
+    
     def get_card_style(self, provider_name: str) -> str:
         """Get style sheet for a card with colored border
         
@@ -209,4 +209,62 @@ class TestAdaptiveBoundsCalculator:
         
         # Expected should be close to 5, not influenced much by outlier
         # 900 / 5 = 180 total, 180 - 50 = 130 remaining
-        assert 120 < bounds.expected < 140  # Allow some tolerance
\ No newline at end of file
+        assert 120 < bounds.expected < 140  # Allow some tolerance
+    
+    
+    def test_sorted_quantile_matches_numpy(self):
+        from claude_dash.core.adaptive_bounds import _sorted_quantile
+        
+        rng = np.random.default_rng(0)
+        for n in (1, 2, 5, 10):
+            values = np.sort(rng.uniform(1, 20, n))
+            for q in (0.025, 0.1, 0.25, 0.5, 0.75, 0.9, 0.975):
+                assert _sorted_quantile(values, q) == pytest.approx(np.percentile(values, q * 100))
+    
+    def test_current_pattern_tracks_last_ten(self):
+        calc = AdaptiveBoundsCalculator(window_size=20)
+        
+        for _ in range(10):
+            calc.add_prompt(12)
+        assert calc.get_current_pattern() == 'complex'
+        
+        # Seven simple prompts push complex below the dominance threshold
+        for _ in range(7):
+            calc.add_prompt(2)
+        assert calc.get_current_pattern() == 'simple'
+        assert sum(calc._pattern_counts) == 10
+    
+    def test_ring_buffer_wraparound(self):
+        calc = AdaptiveBoundsCalculator(window_size=5)
+        
+        for i in range(1, 9):
+            calc.add_prompt(i)
+        
+        assert list(calc.recent_multipliers) == [4, 5, 6, 7, 8]
+        assert calc.pattern_history == ['moderate', 'moderate', 'moderate', 'moderate', 'moderate']
+        assert list(calc._recent_view(3)) == [6, 7, 8]
+    
+    def test_pattern_stats_groups(self):
+        calc = AdaptiveBoundsCalculator()
+        
+        for count in (1, 3, 5, 7, 10, 20):
+            calc.add_prompt(count)
+        
+        stats = calc.get_pattern_stats()
+        assert stats['simple']['mean'] == 2.0
+        assert stats['moderate']['median'] == 6.0
+        assert stats['complex']['std'] == 5.0
+        assert stats['complex']['count'] == 2
+        assert stats['simple']['percentage'] == pytest.approx(100 / 3)
+    
+    def test_reset_clears_history(self):
+        calc = AdaptiveBoundsCalculator()
+        
+        for _ in range(6):
+            calc.add_prompt(12)
+        calc.reset()
+        
+        assert len(calc.recent_multipliers) == 0
+        assert calc.get_current_pattern() == 'mixed'
+        calc.add_prompt(2)
+        assert calc.pattern_history == ['simple']
@@ -34,6 +34,30 @@ class TestLimitBelief:
         assert upper < belief.scale
         assert upper - lower < belief.scale  # Not the full range
     
+    def test_credible_interval_normal_approximation(self):
+        from scipy import stats
+        
+        belief = LimitBelief(alpha=40.0, beta=10.0, scale=1000.0)
+        for confidence in (0.8, 0.95):
+            lower, upper = belief.credible_interval(confidence)
+            dist = stats.beta(belief.alpha, belief.beta)
+            assert abs(lower - dist.ppf((1 - confidence) / 2) * 1000.0) < 15.0
+            assert abs(upper - dist.ppf(1 - (1 - confidence) / 2) * 1000.0) < 15.0
+    
+    def test_credible_interval_cached(self):
+        from claude_dash.core.bayesian_limits import _beta_ppf_pair
+        
+        first = LimitBelief(alpha=10.0, beta=5.0, scale=1000.0)
+        second = LimitBelief(alpha=10.0, beta=5.0, scale=500.0)
+        hits = _beta_ppf_pair.cache_info().hits
+        
+        lower, upper = first.credible_interval(0.8)
+        lower2, upper2 = second.credible_interval(0.8)
+        
+        assert _beta_ppf_pair.cache_info().hits > hits
+        assert lower2 == pytest.approx(lower / 2)
+        assert upper2 == pytest.approx(upper / 2)
+    
     def test_update_close_to_limit(self):
         belief = LimitBelief(alpha=4.0, beta=2.0, scale=1000.0)
         initial_mean = belief.mean
@@ -85,6 +109,18 @@ class TestLimitBelief:
         # Should not update
         assert belief.alpha == initial_alpha
         assert belief.beta == initial_beta
+    
+    def test_update_batch_matches_sequential_updates(self):
+        observations = [950.0, 850.0, 750.0, 500.0, 910.0]
+        sequential = LimitBelief(alpha=4.0, beta=2.0, scale=1000.0)
+        for obs in observations:
+            sequential.update(obs)
+        
+        batched = LimitBelief(alpha=4.0, beta=2.0, scale=1000.0)
+        batched.update_batch(np.array(observations))
+        
+        assert batched.alpha == pytest.approx(sequential.alpha)
+        assert batched.beta == pytest.approx(sequential.beta)
 
 
 class TestBayesianLimitEstimator:
@@ -166,6 +202,39 @@ class TestBayesianLimitEstimator:
         limits = estimator.get_estimated_limits()
         assert limits["prompts"]["confidence"] == 0.95
     
+    def test_update_from_sessions_batch(self):
+        sessions = [
+            {"max_tokens": 390000, "max_messages": 1900, "max_prompts": 700},
+            {"max_tokens": 100000, "max_messages": 1700, "max_prompts": 790},
+            {"max_tokens": 300000, "max_messages": 500, "max_prompts": 610},
+        ]
+        sequential = BayesianLimitEstimator("max20x")
+        for session in sessions:
+            sequential.update_from_session(session)
+        
+        batched = BayesianLimitEstimator("max20x")
+        batched.update_from_sessions_batch(
+            np.array([s["max_tokens"] for s in sessions]),
+            np.array([s["max_messages"] for s in sessions]),
+            np.array([s["max_prompts"] for s in sessions]),
+        )
+        
+        assert batched.total_observations == 3
+        for name in ("tokens", "messages", "prompts"):
+            assert getattr(batched.limits, name).alpha == pytest.approx(getattr(sequential.limits, name).alpha)
+            assert getattr(batched.limits, name).beta == pytest.approx(getattr(sequential.limits, name).beta)
+    
+    def test_get_estimated_limits_cached_until_update(self):
+        estimator = BayesianLimitEstimator("max20x")
+        
+        limits = estimator.get_estimated_limits()
+        assert estimator.get_estimated_limits() is limits
+        
+        estimator.update_from_session({"max_prompts": 790})
+        updated = estimator.get_estimated_limits()
+        assert updated is not limits
+        assert updated["prompts"]["estimate"] > limits["prompts"]["estimate"]
+    
     def test_predict_limit_times_no_usage(self):
         estimator = BayesianLimitEstimator()
         
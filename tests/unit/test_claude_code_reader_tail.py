@@ -0,0 +1,376 @@
+import os
+import pytest
+import json
+from datetime import datetime, timezone, timedelta
+
+from claude_dash.providers.claude_code_reader import ClaudeCodeReader
+
+
+def make_entry(index, seconds_ago, entry_type="assistant"):
+    timestamp = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=seconds_ago)
+    entry = {
+        "type": entry_type,
+        "timestamp": timestamp.strftime("%Y-%m-%dT%H:%M:%S.") + f"{timestamp.microsecond // 1000:03d}Z",
+        "requestId": f"req_{index}",
+        "message": {
+            "id": f"msg_{index}",
+            "model": "claude-sonnet-4-20250514",
+            "usage": {"input_tokens": 10, "output_tokens": 5}
+        }
+    }
+    return json.dumps(entry) + "\n"
+
+
+@pytest.fixture
+def reader(tmp_path):
+    reader = ClaudeCodeReader()
+    reader.claude_dir = tmp_path
+    reader._disk_cache = None
+    return reader
+
+
+class TestIncrementalTail:
+    def test_tail_reads_only_appended_lines(self, reader, tmp_path):
+        log = tmp_path / "project" / "session.jsonl"
+        log.parent.mkdir()
+        log.write_text(make_entry(1, 120) + make_entry(2, 100))
+
+        assert len(reader._load_usage_entries(hours_back=24, track_offsets=True)) == 2
+        assert reader._tail_usage_entries(24) == []
+
+        with open(log, "a") as f:
+            f.write(make_entry(3, 60))
+
+        tail = reader._tail_usage_entries(24)
+        assert [e["request_id"] for e in tail] == ["req_3"]
+        assert reader._file_offsets[log][1] == log.stat().st_size
+
+    def test_partial_line_is_read_again_once_complete(self, reader, tmp_path):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 120))
+        reader._load_usage_entries(hours_back=24, track_offsets=True)
+
+        line = make_entry(2, 60)
+        with open(log, "a") as f:
+            f.write(line[:20])
+        assert reader._tail_usage_entries(24) == []
+
+        with open(log, "a") as f:
+            f.write(line[20:])
+        assert [e["request_id"] for e in reader._tail_usage_entries(24)] == ["req_2"]
+
+    def test_truncated_or_new_files_are_read_from_start(self, reader, tmp_path):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 120) + make_entry(2, 100))
+        reader._load_usage_entries(hours_back=24, track_offsets=True)
+
+        log.write_text(make_entry(3, 60))
+        (tmp_path / "other.jsonl").write_text(make_entry(4, 30))
+
+        tail = reader._tail_usage_entries(24)
+        assert sorted(e["request_id"] for e in tail) == ["req_3", "req_4"]
+
+    def test_incremental_refresh_adds_new_entries_to_blocks(self, reader, tmp_path):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 30))
+        reader._update_session_blocks()
+        before = sum(b.assistant_message_count for b in reader._session_blocks)
+
+        with open(log, "a") as f:
+            f.write(make_entry(2, 5))
+        reader._update_session_blocks(force_refresh=True)
+
+        assert sum(b.assistant_message_count for b in reader._session_blocks) == before + 1
+
+    def test_empty_file_then_first_line(self, reader, tmp_path):
+        log = tmp_path / "session.jsonl"
+        log.write_text("")
+        assert reader._load_usage_entries(hours_back=24, track_offsets=True) == []
+
+        log.write_text(make_entry(1, 60))
+        assert [e["request_id"] for e in reader._tail_usage_entries(24)] == ["req_1"]
+
+
+    def test_lines_without_timestamp_or_request_id_are_not_decoded(self, reader, tmp_path, monkeypatch):
+        log = tmp_path / "session.jsonl"
+        log.write_text('{"type":"summary","summary":"Refactor","leafUuid":"abc"}\n' + make_entry(1, 60))
+
+        decoded = []
+        original = reader._parse_usage_line
+        monkeypatch.setattr(reader, "_parse_usage_line",
+                            lambda line, *args: decoded.append(line) or original(line, *args))
+
+        assert [e["request_id"] for e in reader._load_usage_entries(hours_back=24)] == ["req_1"]
+        assert len(decoded) == 1
+
+    def test_old_lines_without_request_id_are_not_decoded(self, reader, tmp_path, monkeypatch):
+        old_prompt = json.loads(make_entry(1, 7200, "user"))
+        del old_prompt["requestId"]
+        new_prompt = json.loads(make_entry(2, 60, "user"))
+        del new_prompt["requestId"]
+        log = tmp_path / "session.jsonl"
+        log.write_text(json.dumps(old_prompt) + "\n" + make_entry(3, 7200) +
+                       json.dumps(new_prompt) + "\n" + make_entry(3, 60))
+
+        decoded = []
+        original = reader._parse_usage_line
+        monkeypatch.setattr(reader, "_parse_usage_line",
+                            lambda line, *args: decoded.append(line) or original(line, *args))
+
+        # The old assistant line is still decoded so its copy is dropped as a duplicate
+        entries = reader._load_usage_entries(hours_back=1)
+        assert [e["type"] for e in entries] == ["user"]
+        assert len(decoded) == 3
+
+
+class TestParallelLoad:
+    def test_duplicates_across_files_are_kept_once(self, reader, tmp_path):
+        for name in ("a.jsonl", "b.jsonl", "c.jsonl"):
+            (tmp_path / name).write_text(make_entry(1, 60) + make_entry(2, 30))
+        (tmp_path / "d.jsonl").write_text(make_entry(3, 10))
+
+        entries = reader._load_usage_entries(hours_back=24)
+        assert [e["request_id"] for e in entries] == ["req_1", "req_2", "req_3"]
+
+
+    def test_files_untouched_since_cutoff_are_skipped(self, reader, tmp_path, monkeypatch):
+        old = tmp_path / "nested" / "old.jsonl"
+        old.parent.mkdir()
+        old.write_text(make_entry(1, 7200))
+        stale = (datetime.now() - timedelta(hours=2)).timestamp()
+        os.utime(old, (stale, stale))
+        (tmp_path / "new.jsonl").write_text(make_entry(2, 60))
+
+        parsed = []
+        original = reader._parse_jsonl_file
+        monkeypatch.setattr(reader, "_parse_jsonl_file",
+                            lambda path, cutoff: parsed.append(path.name) or original(path, cutoff))
+
+        entries = reader._load_usage_entries(hours_back=1, track_offsets=True)
+        assert [e["request_id"] for e in entries] == ["req_2"]
+        assert parsed == ["new.jsonl"]
+        assert reader._file_offsets[old][1] == old.stat().st_size
+
+
+class TestFileCache:
+    def test_unchanged_files_are_not_parsed_again(self, reader, tmp_path, monkeypatch):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 120) + make_entry(2, 60))
+        (tmp_path / "other.jsonl").write_text(make_entry(3, 30))
+        assert len(reader._load_usage_entries(hours_back=24)) == 3
+
+        parsed = []
+        original = reader._parse_jsonl_file
+        monkeypatch.setattr(reader, "_parse_jsonl_file",
+                            lambda path, cutoff: parsed.append(path.name) or original(path, cutoff))
+
+        assert len(reader._load_usage_entries(hours_back=24)) == 3
+        assert parsed == []
+
+        with open(log, "a") as f:
+            f.write(make_entry(4, 10))
+        entries = reader._load_usage_entries(hours_back=24)
+        assert parsed == ["session.jsonl"]
+        assert sorted(e["request_id"] for e in entries) == ["req_1", "req_2", "req_3", "req_4"]
+
+    def test_cached_results_are_narrowed_to_a_later_cutoff(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 7200) + make_entry(2, 60))
+        assert len(reader._load_usage_entries(hours_back=24)) == 2
+        assert [e["request_id"] for e in reader._load_usage_entries(hours_back=1)] == ["req_2"]
+        assert len(reader._load_usage_entries(hours_back=24)) == 2
+
+
+class TestDiskCache:
+    def test_new_reader_reuses_results_from_disk(self, reader, tmp_path, tmp_path_factory, monkeypatch):
+        from claude_dash.core.parse_cache import ParsedFileCache
+
+        cache_dir = tmp_path_factory.mktemp("cache")
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 7200) + make_entry(2, 60))
+        reader._disk_cache = ParsedFileCache(cache_dir)
+        assert len(reader._load_usage_entries(hours_back=24)) == 2
+
+        fresh = ClaudeCodeReader()
+        fresh.claude_dir = tmp_path
+        fresh._disk_cache = ParsedFileCache(cache_dir)
+        monkeypatch.setattr(fresh, "_read_jsonl_file", lambda *args: pytest.fail("file was parsed"))
+
+        assert [e["request_id"] for e in fresh._load_usage_entries(hours_back=1)] == ["req_2"]
+
+
+class TestParseTimestamp:
+    def test_zulu_and_offset_timestamps_are_naive(self):
+        from claude_dash.providers.claude_code_reader import _parse_timestamp
+
+        assert _parse_timestamp("2025-07-01T12:34:56.789Z") == datetime(2025, 7, 1, 12, 34, 56, 789000)
+        assert _parse_timestamp("2025-07-01T12:34:56+00:00") == datetime(2025, 7, 1, 12, 34, 56)
+
+
+class TestWarmUp:
+    def test_warm_up_loads_blocks_and_releases_waiters(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 30))
+
+        assert not reader.wait_until_warm(timeout=0)
+        reader.warm_up()
+
+        assert reader.wait_until_warm(timeout=0)
+        assert sum(b.assistant_message_count for b in reader._session_blocks) == 1
+
+
+class TestSessionBlockColumns:
+    def test_token_columns_track_entries(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 600) + make_entry(2, 300))
+        reader._update_session_blocks()
+        block = reader._session_blocks[-1]
+
+        assert [datetime(1970, 1, 1) + timedelta(microseconds=us) for us in block.entry_timestamps] == \
+            [e["timestamp"] for e in block.entries]
+        assert list(block.cumulative_tokens) == [15, 30]
+        assert reader._window_start(block, block.entry_timestamps[1]) == 1
+        assert reader.calculate_hourly_burn_rate() > 0
+
+    def test_burn_rate_falls_back_to_the_previous_hour(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 6000) + make_entry(2, 4200))
+        reader._update_session_blocks()
+
+        # 30 tokens over the 30 minutes between the two entries
+        assert reader.calculate_hourly_burn_rate() == pytest.approx(1.0)
+
+    def test_bounds_calculator_gets_the_newest_prompt_counts(self, reader, tmp_path):
+        lines = []
+        for i in range(200):
+            entry_type = "user" if i % 7 in (0, 3) or i % 11 == 0 else "assistant"
+            entry = json.loads(make_entry(i, 12000 - i * 50, entry_type))
+            if entry_type == "user" and i % 3 == 0:
+                entry["message"]["content"] = [{"type": "tool_result", "content": "ok"}]
+            lines.append(json.dumps(entry) + "\n")
+        (tmp_path / "session.jsonl").write_text("".join(lines))
+        reader._update_session_blocks()
+        reader.update_bounds_calculator()
+
+        # Message counts between real user entries, scanned straight off the entries
+        expected = []
+        for block in reader._session_blocks:
+            current = 0
+            for entry in block.entries:
+                if entry["type"] == "user" and not entry["is_tool_result"] and current:
+                    expected.append(current)
+                    current = 0
+                elif entry["type"] == "assistant":
+                    current += 1
+            if current:
+                expected.append(current)
+
+        assert len(expected) > reader._bounds_calculator.window_size
+        assert list(reader._bounds_calculator.recent_multipliers) == expected[-30:]
+
+
+class TestCurrentBlock:
+    def test_current_block_is_found_among_older_blocks(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(
+            make_entry(1, 20 * 3600) + make_entry(2, 12 * 3600) + make_entry(3, 600))
+        reader._update_session_blocks()
+
+        current = reader._find_current_block()
+        assert current is reader._session_blocks[-1]
+        assert [e["request_id"] for e in current.entries] == ["req_3"]
+
+        reader._session_blocks = reader._session_blocks[:-1]
+        assert reader._find_current_block() is None
+
+
+class TestUsageCache:
+    def test_repeat_since_date_request_skips_reload(self, reader, tmp_path, monkeypatch):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 600))
+        since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+
+        first = reader.get_usage_data(since)
+        first["model_breakdown"].clear()
+
+        monkeypatch.setattr(reader, "_update_session_blocks", lambda *args, **kwargs: pytest.fail("reloaded"))
+        second = reader.get_usage_data(since)
+        assert second["total_input_tokens"] == 10
+        assert list(second["model_breakdown"]) == ["claude-sonnet-4-20250514"]
+
+    def test_async_request_with_fresh_cache_skips_executor(self, reader, tmp_path, monkeypatch):
+        import asyncio
+
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 600))
+        expected = reader.get_usage_data()
+
+        monkeypatch.setattr(reader, "get_usage_data", lambda *args: pytest.fail("ran in executor"))
+        progress = []
+        assert asyncio.run(reader.get_usage_data_async(progress_callback=progress.append)) == expected
+        assert progress == ["Reading Claude Code usage...", "Processed 1 files"]
+
+    def test_since_date_keeps_blocks_ending_after_it(self, reader, tmp_path):
+        (tmp_path / "session.jsonl").write_text(
+            make_entry(1, 30 * 3600) + make_entry(2, 20 * 3600) + make_entry(3, 600))
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        assert reader.get_usage_data(now - timedelta(days=2))["session_count"] == 3
+        assert reader.get_usage_data(now - timedelta(hours=10))["session_count"] == 1
+        # The active block is kept even when since_date is past its end
+        assert reader.get_usage_data(now + timedelta(hours=6))["session_count"] == 1
+
+    def test_since_date_within_loaded_horizon_reuses_blocks(self, reader, tmp_path, monkeypatch):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 30 * 3600) + make_entry(2, 600))
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        monkeypatch.setattr(reader, "USAGE_CACHE_TTL", 0)
+
+        assert reader.get_usage_data(now - timedelta(days=2))["session_count"] == 2
+        assert reader._load_horizon(72) == 168 and reader._load_horizon(800) == 1440
+
+        with open(log, "a") as f:
+            f.write(make_entry(3, 60))
+        monkeypatch.setattr(reader, "_load_usage_entries", lambda *args, **kwargs: pytest.fail("reloaded"))
+        usage = reader.get_usage_data(now - timedelta(days=3))
+        assert usage["session_count"] == 2
+        assert usage["total_input_tokens"] == 30
+
+
+class TestHistoricalMaximums:
+    def test_live_blocks_are_untouched_and_result_is_cached(self, reader, tmp_path, monkeypatch):
+        (tmp_path / "session.jsonl").write_text(make_entry(1, 30 * 3600) + make_entry(2, 60))
+        reader._update_session_blocks()
+        live, version = reader._session_blocks, reader._blocks_version
+
+        first = reader.get_historical_session_maximums(days_back=7)
+        assert first["sessions_analyzed"] == 1 and first["max_tokens"] == 15
+        assert reader._session_blocks is live and reader._blocks_version == version
+
+        monkeypatch.setattr(reader, "_load_usage_entries", lambda *args, **kwargs: pytest.fail("reloaded"))
+        assert reader.get_historical_session_maximums(days_back=7) == first
+
+
+class TestMultiplicationFactor:
+    def test_factor_is_recomputed_only_when_blocks_change(self, reader, tmp_path):
+        log = tmp_path / "session.jsonl"
+        log.write_text(make_entry(1, 600, "user") + make_entry(2, 300) + make_entry(3, 200))
+        reader._update_session_blocks()
+
+        first = reader.calculate_message_multiplication_factor()
+        assert first["overall_factor"] == 2.0
+        first["model_factors"].clear()
+        assert reader.calculate_message_multiplication_factor()["model_factors"] == {
+            "claude-sonnet-4-20250514": 2.0}
+
+        with open(log, "a") as f:
+            f.write(make_entry(4, 100))
+        reader._update_session_blocks(force_refresh=True)
+        assert reader.calculate_message_multiplication_factor()["overall_factor"] == 3.0
+
+class TestClose:
+    def test_close_and_collection_shut_down_the_pools(self, tmp_path):
+        import gc
+
+        with ClaudeCodeReader() as reader:
+            executors = (reader._executor, reader._file_executor)
+        assert all(executor._shutdown for executor in executors)
+        reader.close()
+
+        reader = ClaudeCodeReader()
+        executors = (reader._executor, reader._file_executor)
+        del reader
+        gc.collect()
+        assert all(executor._shutdown for executor in executors)
@@ -0,0 +1,27 @@
+import pytest
+
+from claude_dash.core.config_loader import ConfigLoader
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    loader = ConfigLoader()
+    loader.config.setdefault("claude_code", {})["subscription_plan"] = "auto"
+    return loader
+
+
+class TestPlanDetection:
+    def test_detected_plan_is_reused_until_reload(self, loader, monkeypatch):
+        detections = []
+        monkeypatch.setattr(loader, "_detect_plan_from_usage",
+                            lambda: detections.append(1) or "max5x")
+
+        assert loader.get_subscription_plan() == "max5x"
+        assert loader.get_plan_info() is not None
+        assert len(detections) == 1
+
+        loader.reload_config()
+        loader.config.setdefault("claude_code", {})["subscription_plan"] = "auto"
+        assert loader.get_subscription_plan() == "max5x"
+        assert len(detections) == 2
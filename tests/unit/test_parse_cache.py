@@ -0,0 +1,51 @@
+import os
+import pickle
+from datetime import datetime
+
+from claude_dash.core.parse_cache import ParsedFileCache
+
+
+def test_round_trip_and_invalidation(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache")
+    log = tmp_path / "session.jsonl"
+    log.write_text("{}\n")
+    cutoff = datetime(2025, 7, 1)
+    result = (log.stat().st_ino, [{"request_id": "req_1"}], {("msg_1", "req_1")}, 3)
+
+    assert cache.load(log, log.stat()) is None
+    cache.store(log, log.stat(), cutoff, result)
+    assert cache.load(log, log.stat()) == (cutoff, result)
+
+    log.write_text("{}\n{}\n")
+    assert cache.load(log, log.stat()) is None
+
+
+def test_other_format_versions_are_ignored(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache")
+    log = tmp_path / "session.jsonl"
+    log.write_text("{}\n")
+    cache.store(log, log.stat(), None, (0, [], set(), 3))
+
+    record_path = cache._record_path(log)
+    with open(record_path, "rb") as f:
+        record = pickle.load(f)
+    record["version"] = ParsedFileCache.FORMAT_VERSION + 1
+    with open(record_path, "wb") as f:
+        pickle.dump(record, f)
+
+    assert cache.load(log, log.stat()) is None
+    assert [p for p in os.listdir(tmp_path / "cache") if p.endswith(".tmp")] == []
+
+
+def test_prune_drops_only_old_records(tmp_path):
+    cache = ParsedFileCache(tmp_path / "cache")
+    fresh, stale = tmp_path / "fresh.jsonl", tmp_path / "stale.jsonl"
+    for log in (fresh, stale):
+        log.write_text("{}\n")
+        cache.store(log, log.stat(), None, (0, [], set(), 3))
+    old = cache._record_path(stale).stat().st_mtime - 3600
+    os.utime(cache._record_path(stale), (old, old))
+
+    assert cache.prune(1800) == 1
+    assert cache.load(fresh, fresh.stat()) is not None
+    assert cache.load(stale, stale.stat()) is None